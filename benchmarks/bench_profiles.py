@@ -0,0 +1,74 @@
+"""
+对比逐条生成与批量生成个人档案的耗时。
+
+用法：
+    python benchmarks/bench_profiles.py [-n 100000]
+
+- per-field：逐个调用 Faker 的字段方法拼装档案（逐条生成的做法，字段方法本身已经优化）
+- profile：循环调用 Faker.profile()，即每次调用 profiles(1)
+- profiles：调用一次 Faker.profiles(n)
+"""
+
+import argparse
+import time
+
+from czo import Faker
+
+
+def per_field(faker: Faker) -> dict:
+    id_number = faker.id_number()
+    return {
+        "Name": faker.full_name(),
+        "Sex": faker.sex(),
+        "Age": faker.age(),
+        "Occupation": faker.occupation(),
+        "Ethnicity": faker.ethnicity(),
+        "School": faker.school(),
+        "Religion": faker.religion(),
+        "Phone Number": faker.phone_number(),
+        "Landline Number": faker.landline_number(),
+        "Address": f"{faker.province(long=True)}{faker.residence()}",
+        "Residence": faker.residence(),
+        "ID Card": id_number,
+        "MAC": faker.mac_address(),
+        "Passport Number": faker.passport_number(),
+        "Longitude": faker.latitude(),
+        "Latitude": faker.longitude(),
+        "Country": faker.country(),
+        "Marital": faker.marital(),
+        "Email": faker.email(),
+        "ID Type": faker.id_type(),
+        "Education": faker.education(),
+        "License Plate": faker.license_plate(),
+    }
+
+
+def measure(label: str, func, n: int) -> float:
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<10} {n / elapsed:>12,.0f} 条/秒  {elapsed / n * 1e6:>8.2f} 微秒/条")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-n", type=int, default=100000, help="生成的档案数量")
+    args = parser.parse_args()
+    n: int = args.n
+
+    faker = Faker()
+    faker.profiles(1)  # 预热：加载数据模块并构建查找表
+
+    per_field_time = measure(
+        "per-field", lambda: [per_field(faker) for _ in range(n)], n
+    )
+    profile_time = measure("profile", lambda: [faker.profile() for _ in range(n)], n)
+    profiles_time = measure("profiles", lambda: faker.profiles(n), n)
+
+    print(f"profiles 相对 per-field 加速 {per_field_time / profiles_time:.1f} 倍")
+    print(f"profiles 相对 profile 加速 {profile_time / profiles_time:.1f} 倍")
+
+
+if __name__ == "__main__":
+    main()
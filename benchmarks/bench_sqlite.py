@@ -0,0 +1,65 @@
+"""
+对比逐行插入与 Faker.to_sqlite 批量导入 SQLite 的耗时。
+
+用法：
+    python benchmarks/bench_sqlite.py [-n 100000] [--seed 1]
+
+- per-row：每条记录调用一次 profile()，执行一次 INSERT 并提交（即原来的做法）
+- to_sqlite：调用一次 Faker.to_sqlite，按块 executemany 写入，最后建索引
+
+两种做法写入相同的字段并在 id_card 上建索引；固定种子时结果可以重复。
+"""
+
+import argparse
+import os
+import sqlite3
+import tempfile
+import time
+
+from czo import Faker
+
+FIELDS = ["name", "sex", "age", "phone_number", "id_card", "address"]
+KEYS = ["Name", "Sex", "Age", "Phone Number", "ID Card", "Address"]
+
+
+def per_row(path: str, n: int, seed: int) -> None:
+    faker = Faker(seed)
+    with sqlite3.connect(path) as connection:
+        connection.execute(f"CREATE TABLE people ({', '.join(FIELDS)})")
+        connection.execute("CREATE INDEX people_id_card_idx ON people (id_card)")
+        insert = f"INSERT INTO people VALUES ({', '.join('?' * len(FIELDS))})"
+        for _ in range(n):
+            profile = faker.profile()
+            connection.execute(insert, [profile[key] for key in KEYS])
+            connection.commit()
+
+
+def bulk(path: str, n: int, seed: int) -> None:
+    Faker(seed).to_sqlite(path, "people", n, fields=FIELDS, indexes=["id_card"])
+
+
+def measure(label: str, func, n: int, seed: int) -> float:
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bench.db")
+        start = time.perf_counter()
+        func(path, n, seed)
+        elapsed = time.perf_counter() - start
+    print(f"{label:<10} {n / elapsed:>12,.0f} 行/秒  {elapsed:>8.2f} 秒")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-n", type=int, default=100000, help="写入的行数")
+    parser.add_argument("--seed", type=int, default=1, help="随机种子")
+    args = parser.parse_args()
+
+    Faker(preload=True)  # 预热：加载数据集并构建查找表
+
+    per_row_time = measure("per-row", per_row, args.n, args.seed)
+    bulk_time = measure("to_sqlite", bulk, args.n, args.seed)
+    print(f"to_sqlite 相对 per-row 加速 {per_row_time / bulk_time:.1f} 倍")
+
+
+if __name__ == "__main__":
+    main()
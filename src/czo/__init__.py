@@ -1,12 +1,17 @@
 """
 辅助测试的一些常用功能
+
+各个类在第一次访问时才导入所在的模块，例如只使用 DateTime 时不会导入 Faker 和它依赖的模块。
 """
 
-from .utils.datetime import DateTime, Timer
-from .utils.faker import Faker
-from .utils.net import Net
-from .utils.paths import Paths
-from .utils.randgen import Rand
+# 不导入 typing，避免拖慢 import czo；类型检查器把 TYPE_CHECKING 常量视为 True
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .utils.datetime import DateTime, Timer
+    from .utils.faker import Faker
+    from .utils.net import Net
+    from .utils.paths import Paths
+    from .utils.randgen import Rand
 
 __all__: list[str] = [
     "Timer",
@@ -16,3 +21,27 @@ __all__: list[str] = [
     "Paths",
     "Faker",
 ]
+
+# 公开名称到所在模块的映射
+_LAZY: dict[str, str] = {
+    "Timer": "utils.datetime",
+    "DateTime": "utils.datetime",
+    "Rand": "utils.randgen",
+    "Net": "utils.net",
+    "Paths": "utils.paths",
+    "Faker": "utils.faker",
+}
+
+
+def __getattr__(name: str) -> object:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # 相对导入 czo.<module>，与 import 语句走同一路径，-X importtime 可以统计到
+    value = getattr(__import__(module, globals(), None, [name], 1), name)
+    globals()[name] = value  # 之后直接从模块字典读取，不再经过 __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
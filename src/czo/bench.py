@@ -0,0 +1,396 @@
+"""
+czo 公共方法的性能基准。
+
+用法：
+    python -m czo.bench [-k 正则] [-o results.json] [--baseline baseline.json] [--threshold 0.1]
+
+逐个测量 Faker、Rand、Net、DateTime 公共方法的每秒调用次数和每次调用分配的内存峰值：
+先预热 warmup 次，再自动确定每轮的调用次数使单轮耗时不少于 min_time 秒，重复 repeat 轮取最好成绩；
+内存用 tracemalloc 单独测量，不影响计时。结果可以写成 JSON，并与之前保存的基线比较，
+每秒调用次数下降或内存增加超过 threshold 时视为退化，命令行以退出码 1 结束。
+
+写文件、启动进程或需要事件循环的方法（如 Rand.random_file、Faker.to_sqlite）不参与测量，
+列在结果的 skipped 中。
+"""
+
+import argparse
+import datetime
+import inspect
+import json
+import platform
+import re
+import statistics
+import sys
+import time
+import timeit
+import tracemalloc
+import warnings
+from collections import deque
+from collections.abc import Callable, Iterator
+from typing import Any, NamedTuple
+
+from .utils.datetime import DateTime
+from .utils.faker import Faker, providers
+from .utils.net import Net
+from .utils.randgen import Rand
+
+# 结果 JSON 的格式版本，格式不兼容时递增
+_FORMAT_VERSION: int = 1
+
+# 内存增加不超过该字节数时不算退化，避免小对象的测量抖动
+_BYTES_SLACK: int = 256
+
+# 不参与测量的方法及原因
+_SKIPPED: dict[str, str] = {
+    "Rand.random_file": "在当前目录写入文件",
+    "Rand.agenerate": "需要事件循环",
+    "Faker.aprofiles": "需要事件循环",
+    "Faker.write_profiles": "写入文件，耗时取决于磁盘",
+    "Faker.to_sqlite": "写入数据库文件，耗时取决于磁盘",
+    "Faker.generate_parallel": "启动进程池",
+    "Faker.register_corpus": "替换全局数据集并写入缓存文件",
+}
+
+
+class Case(NamedTuple):
+    """一个被测方法及其调用参数"""
+
+    name: str
+    func: Callable[..., Any]
+    args: tuple = ()
+    kwargs: dict[str, Any] | None = None
+
+    def __call__(self) -> Any:
+        result = self.func(*self.args, **(self.kwargs or {}))
+        if isinstance(result, Iterator):
+            deque(result, maxlen=0)  # 生成器只有被消费时才真正生成数据
+        return result
+
+
+def _arguments() -> dict[str, tuple[tuple, dict[str, Any]]]:
+    """有必填参数或默认参数不具代表性的方法使用的调用参数"""
+    id_numbers: list[str] = Faker(seed=0).id_numbers(1000)
+    return {
+        "Faker.compile": (({"name": "full_name", "phone": "phone_number"},), {}),
+        "Faker.decode_id_numbers": ((id_numbers,), {}),
+        "Faker.id_numbers": ((1000,), {}),
+        "Faker.iter_profiles": ((1000,), {}),
+        "Faker.profiles": ((1000,), {}),
+        "Faker.spawn": ((4,), {}),
+        "Faker.validate_id_numbers": ((id_numbers,), {}),
+        "Net.cidr_to_subnet": ((24,), {}),
+        "Net.generate_ip_list": ((100,), {}),
+        "Net.ip_in_range": (("192.168.1.10", "192.168.1.0/24"), {}),
+        "Net.ipaddress_generator": ((10,), {"max": 100}),
+        "Net.mac_generator": ((10,), {"max": 100}),
+        "Net.parse_cidr": (("192.168.1.0", 24), {}),
+        "DateTime.date_before_days": ((7,), {}),
+        "DateTime.date_before_hours": ((3,), {}),
+        "DateTime.date_before_minutes": ((30,), {}),
+        "DateTime.date_to_timestamp": (("2022-01-01 12:00:00",), {}),
+        "DateTime.difference_time_two": (
+            ("2022-01-01 10:00:00", "2022-01-01 12:00:00"),
+            {},
+        ),
+        "DateTime.generate_random_date_and_timestamp": (
+            ("2024-01-10 07:08:16", "2024-06-10 07:08:16"),
+            {},
+        ),
+        "DateTime.get_dates_offset_by_days": ((-7, "2024-12-20 00:02:00"), {}),
+        "DateTime.http_header_time_to_str": (("Sat, 01 Jan 2022 12:00:00 GMT",), {}),
+        "DateTime.is_workday": (("2024-12-20",), {}),
+        "DateTime.parse_iso8601": (("2022-01-01T12:00:00Z",), {}),
+        "DateTime.time_handler": (("2022-01-01T12:00:00.000Z",), {}),
+        "DateTime.timestamp_to_date": ((1640995200,), {}),
+        "DateTime.to_timezone": (("2022-01-01T12:00:00+00:00", 8), {}),
+    }
+
+
+def _has_required_parameters(func: Callable[..., Any]) -> bool:
+    """func 是否有没有默认值的参数"""
+    return any(
+        parameter.default is parameter.empty
+        and parameter.kind not in (parameter.VAR_POSITIONAL, parameter.VAR_KEYWORD)
+        for parameter in inspect.signature(func).parameters.values()
+    )
+
+
+def discover(
+    pattern: str | None = None, seed: int = 0
+) -> tuple[list[Case], dict[str, str]]:
+    """
+    收集 Faker、Rand、Net、DateTime 的公共方法。
+
+    Args:
+        pattern: 只保留 "类名.方法名" 与该正则表达式匹配的方法。
+        seed: Faker 实例的随机种子。
+
+    Returns:
+        tuple[list[Case], dict[str, str]]: 被测方法，以及不参与测量的方法及原因。
+    """
+    faker = Faker(seed=seed, preload=True)
+    arguments = _arguments()
+    cases: list[Case] = []
+    skipped: dict[str, str] = {}
+    for owner in (faker, Rand, Net, DateTime):
+        cls: type = owner if isinstance(owner, type) else type(owner)
+        for attr, member in inspect.getmembers(cls):
+            name = f"{cls.__name__}.{attr}"
+            if attr.startswith("_") or attr == "help" or not callable(member):
+                continue
+            if pattern is not None and not re.search(pattern, name):
+                continue
+            if name in _SKIPPED:
+                skipped[name] = _SKIPPED[name]
+                continue
+            func = getattr(owner, attr)
+            if name in arguments:
+                cases.append(Case(name, func, *arguments[name]))
+            elif _has_required_parameters(func):
+                skipped[name] = "缺少调用参数"
+            else:
+                cases.append(Case(name, func))
+    return cases, skipped
+
+
+def _time(
+    case: Case, warmup: int, repeat: int, min_time: float
+) -> tuple[int, list[float]]:
+    """预热后自动确定每轮调用次数，返回 (每轮调用次数, 各轮耗时)"""
+    for _ in range(warmup):
+        case()
+    timer = timeit.Timer(case)
+    number = 1
+    while True:
+        elapsed: float = timer.timeit(number)
+        if elapsed >= min_time:
+            break
+        # 按已测耗时估算达到 min_time 需要的次数，最多放大 10 倍
+        number = max(
+            number + 1,
+            min(number * 10, int(number * min_time / max(elapsed, 1e-9)) + 1),
+        )
+    return number, [elapsed, *timer.repeat(repeat - 1, number)]
+
+
+def _peak_bytes(case: Case, calls: int) -> int:
+    """每次调用期间 tracemalloc 记录的内存峰值增量，取中位数"""
+    tracing: bool = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    try:
+        samples: list[int] = []
+        for _ in range(calls):
+            tracemalloc.reset_peak()
+            before: int = tracemalloc.get_traced_memory()[0]
+            case()
+            samples.append(tracemalloc.get_traced_memory()[1] - before)
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+    return int(statistics.median(samples))
+
+
+def _version() -> str:
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("czo")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def run(
+    pattern: str | None = None,
+    warmup: int = 10,
+    repeat: int = 5,
+    min_time: float = 0.05,
+    memory_calls: int = 20,
+    seed: int = 0,
+    progress: Callable[[str, dict[str, Any]], None] | None = None,
+) -> dict[str, Any]:
+    """
+    运行基准测试。
+
+    Args:
+        pattern: 只测量 "类名.方法名" 与该正则表达式匹配的方法。
+        warmup: 每个方法计时前的预热调用次数。
+        repeat: 计时轮数，结果取最好的一轮。
+        min_time: 每轮的最短耗时（秒），调用次数据此自动确定。
+        memory_calls: 测量内存时的调用次数，结果取中位数。
+        seed: Faker 实例的随机种子。
+        progress: 每测完一个方法调用一次，参数为方法名和该方法的结果。
+
+    Returns:
+        dict: 可直接写成 JSON 的结果，results 为方法名到 ops_per_sec（最好一轮）、
+        ops_per_sec_median、bytes_per_call、number（每轮调用次数）的映射，
+        datasets 为各数据集占用的内存字节数。
+
+    Example:
+        >>> report = run(pattern=r"^Faker\\.(full_name|profile)$")
+        >>> report["results"]["Faker.profile"]["ops_per_sec"]
+    """
+    if repeat <= 0 or memory_calls <= 0:
+        raise ValueError("repeat 和 memory_calls 必须大于 0")
+    cases, skipped = discover(pattern, seed)
+    results: dict[str, dict[str, Any]] = {}
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for case in cases:
+            try:
+                number, times = _time(case, warmup, repeat, min_time)
+                bytes_per_call: int = _peak_bytes(case, memory_calls)
+            except Exception as exc:  # noqa: BLE001
+                skipped[case.name] = f"调用失败：{exc!r}"
+                continue
+            results[case.name] = result = {
+                "ops_per_sec": number / min(times),
+                "ops_per_sec_median": number / statistics.median(times),
+                "bytes_per_call": bytes_per_call,
+                "number": number,
+            }
+            if progress is not None:
+                progress(case.name, result)
+    return {
+        "format": _FORMAT_VERSION,
+        "meta": {
+            "czo": _version(),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "created": datetime.datetime.now().isoformat(timespec="seconds"),
+            "warmup": warmup,
+            "repeat": repeat,
+            "min_time": min_time,
+            "memory_calls": memory_calls,
+            "seed": seed,
+        },
+        "results": results,
+        "skipped": skipped,
+        # discover 已经预加载全部数据集
+        "datasets": providers.footprint(),
+    }
+
+
+def compare(
+    report: dict[str, Any], baseline: dict[str, Any], threshold: float = 0.1
+) -> list[dict[str, Any]]:
+    """
+    与基线比较，返回退化的指标。
+
+    每秒调用次数低于基线的 (1 - threshold) 倍，或每次调用的内存超过基线的 (1 + threshold) 倍
+    （且至少多 256 字节）时视为退化。只比较两边都有的方法。
+
+    Args:
+        report: run 的结果。
+        baseline: 之前保存的 run 的结果。
+        threshold: 允许的相对变化。
+
+    Returns:
+        list[dict]: 每项包含 name、metric、baseline、current、change（相对变化）。
+    """
+    if baseline.get("format") != _FORMAT_VERSION:
+        raise ValueError(f"不支持的基线格式：{baseline.get('format')}")
+    regressions: list[dict[str, Any]] = []
+    current: dict[str, dict[str, Any]] = report["results"]
+    for name, base in baseline["results"].items():
+        if name not in current:
+            continue
+        ops, base_ops = current[name]["ops_per_sec"], base["ops_per_sec"]
+        if ops < base_ops * (1 - threshold):
+            regressions.append(
+                {
+                    "name": name,
+                    "metric": "ops_per_sec",
+                    "baseline": base_ops,
+                    "current": ops,
+                    "change": ops / base_ops - 1,
+                }
+            )
+        size, base_size = current[name]["bytes_per_call"], base["bytes_per_call"]
+        if size > base_size * (1 + threshold) and size - base_size > _BYTES_SLACK:
+            regressions.append(
+                {
+                    "name": name,
+                    "metric": "bytes_per_call",
+                    "baseline": base_size,
+                    "current": size,
+                    "change": size / base_size - 1 if base_size else float("inf"),
+                }
+            )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    """命令行入口，有退化时返回 1"""
+    parser = argparse.ArgumentParser(
+        prog="python -m czo.bench", description=__doc__.splitlines()[1]
+    )
+    parser.add_argument(
+        "-k", dest="pattern", help="只测量匹配该正则表达式的 类名.方法名"
+    )
+    parser.add_argument("-o", "--output", help="结果 JSON 的写入路径")
+    parser.add_argument("--baseline", help="用于比较的基线 JSON")
+    parser.add_argument(
+        "--threshold", type=float, default=0.1, help="允许的相对变化，默认 0.1"
+    )
+    parser.add_argument("--warmup", type=int, default=10, help="预热调用次数")
+    parser.add_argument("--repeat", type=int, default=5, help="计时轮数")
+    parser.add_argument(
+        "--min-time", type=float, default=0.05, help="每轮最短耗时（秒）"
+    )
+    parser.add_argument(
+        "--memory-calls", type=int, default=20, help="测量内存的调用次数"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Faker 的随机种子")
+    args = parser.parse_args(argv)
+
+    baseline: dict[str, Any] | None = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    def progress(name: str, result: dict[str, Any]) -> None:
+        line = f"{name:<48} {result['ops_per_sec']:>14,.0f} 次/秒 {result['bytes_per_call']:>10,} 字节/次"
+        if baseline is not None and name in baseline["results"]:
+            change = (
+                result["ops_per_sec"] / baseline["results"][name]["ops_per_sec"] - 1
+            )
+            line += f" {change:>+8.1%}"
+        print(line, flush=True)
+
+    start = time.perf_counter()
+    report = run(
+        args.pattern,
+        warmup=args.warmup,
+        repeat=args.repeat,
+        min_time=args.min_time,
+        memory_calls=args.memory_calls,
+        seed=args.seed,
+        progress=progress,
+    )
+    for name, reason in report["skipped"].items():
+        print(f"{name:<48} 跳过：{reason}")
+    for name, size in report["datasets"].items():
+        print(f"数据集 {name:<41} {size:>14,} 字节")
+    print(
+        f"共测量 {len(report['results'])} 个方法，耗时 {time.perf_counter() - start:.1f} 秒"
+    )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    if baseline is None:
+        return 0
+    regressions = compare(report, baseline, args.threshold)
+    for item in regressions:
+        print(
+            f"退化 {item['name']} {item['metric']}: "
+            f"{item['baseline']:,.0f} -> {item['current']:,.0f} ({item['change']:+.1%})"
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""
+把 czo.data 中的大型列表打包成 czo/data/packed/<名称>.bin，格式见 czo.utils._table。
+
+用法：
+    python -m czo.data._build          # 重新生成全部打包文件
+    python -m czo.data._build --check  # 只检查打包文件是否与源数据一致，不一致时退出码为 1
+
+源数据仍然是本目录下的 Python 模块，修改后需要重新运行本脚本；tests 中的用例会检查打包文件是否过期。
+源数据为字典时，每个条目由键和值首尾相接组成，例如区域代码表的 "330108浙江省杭州市滨江区"。
+"""
+
+import argparse
+import importlib
+import sys
+from pathlib import Path
+
+from ..utils._table import Table, pack
+
+# 打包的数据集名称到（源模块，变量名）的映射
+SOURCES: dict[str, tuple[str, str]] = {
+    "address": ("czo.data._addr", "addr_info_list"),
+    "store_name": ("czo.data._shop_sign", "shop_sign_list"),
+    "residence": ("czo.data._housing", "housing"),
+    "area": ("czo.data._internal_utils", "data_dict"),
+    "country_zh": ("czo.data._country", "zh_country"),
+    "country_en": ("czo.data._country", "en_country"),
+}
+
+PACKED_DIR: Path = Path(__file__).with_name("packed")
+
+
+def build(name: str) -> bytes:
+    """由源模块生成数据集 name 的打包内容，重复条目去重并累计权重"""
+    module, attr = SOURCES[name]
+    items = getattr(importlib.import_module(module), attr)
+    if isinstance(items, dict):
+        items = [key + value for key, value in items.items()]
+    return pack(Table.from_items(items))
+
+
+def stale(directory: Path = PACKED_DIR) -> list[str]:
+    """内容与源数据不一致或缺失的打包文件对应的数据集名称"""
+    result: list[str] = []
+    for name in SOURCES:
+        path = directory / f"{name}.bin"
+        if not path.is_file() or path.read_bytes() != build(name):
+            result.append(name)
+    return result
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m czo.data._build", description=__doc__.splitlines()[1]
+    )
+    parser.add_argument("--check", action="store_true", help="只检查，不写入")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        names = stale()
+        for name in names:
+            print(f"{name}.bin 已过期，请运行 python -m czo.data._build")
+        return 1 if names else 0
+
+    PACKED_DIR.mkdir(exist_ok=True)
+    for name in SOURCES:
+        data: bytes = build(name)
+        (PACKED_DIR / f"{name}.bin").write_bytes(data)
+        print(f"{name}.bin {len(data):,} 字节")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -545,6 +545,74 @@ landline_number_prefix: list[str] = [
 ]
 """座机区号"""
 
+landline_prefix_provinces: dict[str, str] = {
+    "010": "11",
+    "022": "12",
+    "031": "13",
+    "033": "13",
+    "035": "14",
+    "0349": "14",
+    "047": "15",
+    "048": "15",
+    "024": "21",
+    "041": "21",
+    "042": "21",
+    "0423": "22",
+    "043": "22",
+    "044": "22",
+    "045": "23",
+    "046": "23",
+    "021": "31",
+    "025": "32",
+    "051": "32",
+    "052": "32",
+    "057": "33",
+    "058": "33",
+    "055": "34",
+    "056": "34",
+    "059": "35",
+    "070": "36",
+    "079": "36",
+    "053": "37",
+    "054": "37",
+    "063": "37",
+    "037": "41",
+    "039": "41",
+    "027": "42",
+    "071": "42",
+    "072": "42",
+    "073": "43",
+    "074": "43",
+    "020": "44",
+    "066": "44",
+    "075": "44",
+    "076": "44",
+    "077": "45",
+    "0898": "46",
+    "023": "50",
+    "028": "51",
+    "081": "51",
+    "082": "51",
+    "083": "51",
+    "085": "52",
+    "069": "53",
+    "087": "53",
+    "088": "53",
+    "089": "54",
+    "029": "61",
+    "091": "61",
+    "093": "62",
+    "094": "62",
+    "097": "63",
+    "095": "64",
+    "090": "65",
+    "099": "65",
+    "886": "71",
+    "00852": "81",
+    "00853": "82",
+}
+"""座机区号前缀到省级区域代码（前 2 位）的映射，按最长前缀匹配"""
+
 occupation = [
     "教师",
     "工人",
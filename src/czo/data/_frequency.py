@@ -0,0 +1,248 @@
+"""
+常用字段取值的相对频率，用于 Faker(weighted=True) 的加权抽样。
+
+数值只表示相对大小，按近似的人口比例整理：姓氏按每十万人中的人数，名字按常见程度，
+民族和省份按第七次全国人口普查的人口数（千人；港澳台按当地统计），学历按每万人中的人数。
+"""
+
+frequency: dict[str, dict[str, int]] = {
+    "last_name": {
+        "赵": 2290,
+        "钱": 200,
+        "孙": 1540,
+        "李": 7000,
+        "周": 1940,
+        "吴": 2050,
+        "郑": 1030,
+        "王": 7120,
+        "冯": 670,
+        "陈": 4530,
+        "褚": 10,
+        "卫": 40,
+        "蒋": 500,
+        "沈": 400,
+        "韩": 650,
+        "杨": 3080,
+        "朱": 1260,
+        "秦": 300,
+        "尤": 30,
+        "许": 870,
+        "何": 1180,
+        "吕": 460,
+        "施": 140,
+        "张": 6650,
+        "孔": 170,
+        "曹": 710,
+        "严": 150,
+        "华": 50,
+        "金": 230,
+        "魏": 500,
+        "陶": 260,
+        "姜": 460,
+        "戚": 30,
+        "谢": 850,
+        "邹": 310,
+        "喻": 70,
+        "柏": 20,
+        "水": 2,
+        "窦": 50,
+        "章": 100,
+        "云": 20,
+        "苏": 500,
+        "潘": 400,
+        "葛": 100,
+        "奚": 10,
+        "范": 400,
+        "彭": 800,
+        "郎": 30,
+        "鲁": 100,
+        "韦": 280,
+        "昌": 3,
+        "马": 1070,
+        "苗": 90,
+        "凤": 10,
+        "花": 10,
+        "方": 370,
+        "俞": 80,
+        "任": 400,
+        "袁": 550,
+        "柳": 50,
+        "酆": 1,
+        "鲍": 60,
+        "史": 200,
+        "唐": 740,
+        "费": 40,
+        "廉": 10,
+        "岑": 20,
+        "薛": 220,
+        "雷": 250,
+        "贺": 180,
+        "倪": 70,
+        "汤": 200,
+        "滕": 50,
+        "殷": 60,
+        "罗": 1050,
+        "毕": 60,
+        "郝": 140,
+        "邬": 10,
+        "安": 100,
+        "常": 120,
+        "乐": 20,
+        "于": 600,
+        "时": 50,
+        "傅": 200,
+        "皮": 20,
+        "卞": 20,
+        "齐": 100,
+        "康": 120,
+        "伍": 100,
+        "余": 500,
+        "元": 10,
+        "卜": 10,
+        "顾": 200,
+        "孟": 300,
+        "平": 20,
+        "黄": 2230,
+        "郭": 1450,
+        "轩辕": 1,
+        "公孙": 1,
+        "慕容": 1,
+        "司马": 2,
+    },
+    "first_name": {
+        "伟": 290,
+        "芳": 270,
+        "娜": 250,
+        "秀英": 240,
+        "敏": 230,
+        "静": 225,
+        "丽": 220,
+        "强": 215,
+        "磊": 210,
+        "军": 205,
+        "洋": 200,
+        "勇": 195,
+        "艳": 190,
+        "杰": 185,
+        "娟": 180,
+        "博": 60,
+        "文": 80,
+        "涛": 175,
+        "慧": 100,
+        "明": 170,
+        "建国": 90,
+        "丽丽": 80,
+        "媛": 50,
+        "子涵": 70,
+        "子轩": 75,
+        "浩然": 60,
+        "昊然": 40,
+        "浩": 90,
+        "振华": 50,
+    },
+    "ethnicity": {
+        "汉族": 1286311,
+        "蒙古族": 6290,
+        "回族": 11378,
+        "藏族": 7060,
+        "维吾尔族": 11774,
+        "苗族": 11067,
+        "彝族": 9830,
+        "壮族": 19569,
+        "布依族": 3577,
+        "朝鲜族": 1702,
+        "满族": 10423,
+        "侗族": 3495,
+        "瑶族": 3309,
+        "白族": 2091,
+        "土家族": 9588,
+        "哈尼族": 1733,
+        "哈萨克族": 1562,
+        "傣族": 1329,
+        "黎族": 1603,
+        "傈僳族": 762,
+        "佤族": 430,
+        "畲族": 746,
+        "高山族": 4,
+        "拉祜族": 500,
+        "水族": 496,
+        "东乡族": 774,
+        "纳西族": 323,
+        "景颇族": 160,
+        "柯尔克孜族": 204,
+        "土族": 281,
+        "达斡尔族": 132,
+        "仫佬族": 278,
+        "羌族": 313,
+        "布朗族": 127,
+        "撒拉族": 165,
+        "毛南族": 124,
+        "仡佬族": 677,
+        "锡伯族": 191,
+        "阿昌族": 43,
+        "普米族": 45,
+        "塔吉克族": 50,
+        "怒族": 37,
+        "乌孜别克族": 13,
+        "俄罗斯族": 16,
+        "鄂温克族": 34,
+        "崩龙族": 22,
+        "保安族": 24,
+        "裕固族": 15,
+        "京族": 33,
+        "塔塔尔族": 4,
+        "独龙族": 7,
+        "鄂伦春族": 9,
+        "赫哲族": 5,
+        "门巴族": 11,
+        "珞巴族": 4,
+        "基诺族": 26,
+    },
+    "education": {
+        "小学": 2477,
+        "初中": 3451,
+        "高中": 1000,
+        "中专": 509,
+        "大专": 770,
+        "本科": 690,
+        "硕士": 70,
+        "研究生": 10,
+        "博士": 8,
+    },
+    "province": {
+        "北京市": 21893,
+        "天津市": 13866,
+        "河北省": 74610,
+        "山西省": 34915,
+        "内蒙古自治区": 24049,
+        "辽宁省": 42591,
+        "吉林省": 24074,
+        "黑龙江省": 31850,
+        "上海市": 24870,
+        "江苏省": 84748,
+        "浙江省": 64568,
+        "安徽省": 61027,
+        "福建省": 41540,
+        "江西省": 45189,
+        "山东省": 101528,
+        "河南省": 99366,
+        "湖北省": 57752,
+        "湖南省": 66444,
+        "广东省": 126013,
+        "广西壮族自治区": 50127,
+        "海南省": 10081,
+        "重庆市": 32054,
+        "四川省": 83675,
+        "贵州省": 38562,
+        "云南省": 47209,
+        "西藏自治区": 3648,
+        "陕西省": 39529,
+        "甘肃省": 25020,
+        "青海省": 5924,
+        "宁夏回族自治区": 7202,
+        "新疆维吾尔自治区": 25852,
+        "台湾省": 23561,
+        "香港特别行政区": 7474,
+        "澳门特别行政区": 683,
+    },
+}
@@ -1,13 +1,11 @@
-import inspect
-import unicodedata
-
-
 def count_chr_length(text, no_ascii=2) -> int:
     """
     将 ASCII 字符计算为 1 个单位长度。
 
     将大部分非 ASCII 字符（如汉字、日文、韩文等）计算为 2 个单位长度。
     """
+    import unicodedata
+
     length = 0
     for c in text:
         if unicodedata.east_asian_width(c) in ["F", "W"]:
@@ -19,6 +17,8 @@ def count_chr_length(text, no_ascii=2) -> int:
 
 def _get_methods_and_properties_with_docs(cls, *args, **kwargs):
     """通过这个函数，可以方便地获取类的所有公共方法和属性，并以一种格式化的方式输出它们的名称和文档注释。"""
+    import inspect
+
     methods_and_properties: dict[str, str] = {}
 
     # 获取类的文档注释
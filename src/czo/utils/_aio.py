@@ -0,0 +1,60 @@
+"""
+在后台线程中分批生成数据，供 asyncio 事件循环异步迭代。
+"""
+
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterator
+
+
+def _batch_sizes(n: int, batch: int) -> Iterator[int]:
+    """把 n 切分成每批最多 batch 条"""
+    for start in range(0, n, batch):
+        yield min(batch, n - start)
+
+
+async def aiter_batches(
+    produce: Callable[[int], list], n: int, batch: int, prefetch: int = 2
+) -> AsyncIterator[list]:
+    """
+    在单个后台线程中依次调用 produce(size) 生成 n 条数据，每批最多 batch 条，按顺序异步返回。
+
+    最多提前生成 prefetch 批，消费者处理得慢时后台线程随之停下，内存占用有上限；
+    事件循环只等待已经生成好的批次，不会被整批生成阻塞。只使用一个线程，
+    所以批次的生成顺序固定，固定种子时结果可以重复。提前结束迭代时未开始的批次会被取消。
+
+    Args:
+        produce: 生成一批数据的函数，参数为本批的数量。
+        n: 数据总数。
+        batch: 每批的数量。
+        prefetch: 最多提前生成的批数。
+
+    Raises:
+        ValueError: batch 或 prefetch 小于 1。
+    """
+    if batch <= 0:
+        raise ValueError("batch 必须大于 0")
+    if prefetch <= 0:
+        raise ValueError("prefetch 必须大于 0")
+    # asyncio 和线程池导入较慢，只在真正异步迭代时导入
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor
+
+    loop = asyncio.get_running_loop()
+    sizes: Iterator[int] = _batch_sizes(n, batch)
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="czo-aio")
+    pending: deque[asyncio.Future] = deque()
+    try:
+        for size in sizes:
+            pending.append(loop.run_in_executor(executor, produce, size))
+            if len(pending) >= prefetch:
+                break
+        while pending:
+            result: list = await pending.popleft()
+            size = next(sizes, 0)
+            if size:
+                pending.append(loop.run_in_executor(executor, produce, size))
+            yield result
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False, cancel_futures=True)
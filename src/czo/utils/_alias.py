@@ -0,0 +1,60 @@
+"""
+Vose 别名法加权抽样。
+
+构建别名表需要 O(k)，之后每次抽样只需一个随机数、一次下标访问和一次比较，与取值数量 k 无关。
+"""
+
+from collections.abc import Callable, Sequence
+from typing import Any
+
+
+class AliasTable:
+    """
+    把 k 个加权取值整理成 k 个等概率的桶，每个桶最多包含两个取值。
+
+    随机数 u·k 的整数部分选桶，小数部分与桶内概率比较，决定取桶本身的值还是别名值。
+    """
+
+    __slots__ = ("aliases", "probabilities", "values")
+
+    def __init__(self, values: Sequence[Any], weights: Sequence[float]) -> None:
+        k = len(values)
+        if k == 0 or k != len(weights):
+            raise ValueError("取值和权重必须一一对应且不能为空")
+        total = sum(weights)
+        if total <= 0 or min(weights) < 0:
+            raise ValueError("权重不能为负数，且总和必须大于 0")
+
+        scaled: list[float] = [w * k / total for w in weights]
+        probabilities: list[float] = [1.0] * k
+        aliases: list[int] = list(range(k))
+        small: list[int] = [i for i, p in enumerate(scaled) if p < 1.0]
+        large: list[int] = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            probabilities[less] = scaled[less]
+            aliases[less] = more
+            scaled[more] -= 1.0 - scaled[less]
+            (small if scaled[more] < 1.0 else large).append(more)
+        # 剩下的桶只因浮点误差偏离 1，概率按 1 处理
+
+        self.values: tuple = tuple(values)
+        self.probabilities: tuple[float, ...] = tuple(probabilities)
+        self.aliases: tuple = tuple(values[i] for i in aliases)
+
+    def sample(self, random: Callable[[], float]) -> Any:
+        """用 random（返回 [0, 1) 的浮点数）抽取一个值"""
+        u = random() * len(self.values)
+        i = int(u)
+        return self.values[i] if u - i < self.probabilities[i] else self.aliases[i]
+
+    def samples(self, random: Callable[[], float], n: int) -> list:
+        """用 random 抽取 n 个值"""
+        values, probabilities, aliases = self.values, self.probabilities, self.aliases
+        k = len(values)
+        return [
+            values[i]
+            if (u := random() * k) - (i := int(u)) < probabilities[i]
+            else aliases[i]
+            for _ in range(n)
+        ]
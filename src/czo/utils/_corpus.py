@@ -0,0 +1,219 @@
+"""
+从外部语料文件中均匀抽取固定数量的条目，抽样结果缓存到磁盘。
+
+语料只顺序读取一遍，内存中只保留抽样结果，比内存大的文件也可以使用。
+抽样结果按 czo.utils._table 的打包格式保存，以文件路径、大小、修改时间和抽样参数为键；
+文件没有变化时直接映射缓存文件，不再读取语料。
+"""
+
+import math
+import os
+import random
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from pathlib import Path
+from typing import Literal
+
+from ._table import PackedTable, Table, map_file, pack
+
+CorpusFormat = Literal["text", "csv", "jsonl"]
+
+# 按扩展名推断的语料格式，其余扩展名按每行一个条目的纯文本处理
+_SUFFIX_FORMATS: dict[str, CorpusFormat] = {
+    ".csv": "csv",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+}
+
+
+def default_cache_dir() -> Path:
+    """抽样缓存的默认目录：$CZO_CACHE_DIR，否则为 $XDG_CACHE_HOME/czo/corpus"""
+    if directory := os.environ.get("CZO_CACHE_DIR"):
+        return Path(directory)
+    cache_home: str = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(cache_home) / "czo" / "corpus"
+
+
+def reservoir_sample(items: Iterable[str], k: int, rng: random.Random) -> list[str]:
+    """
+    从 items 中等概率地抽取 k 个条目（不放回），items 只遍历一遍。
+
+    使用 Li 的 L 算法：蓄水池填满后按几何分布直接算出下一个被替换的位置，
+    跳过的条目不需要生成随机数。条目不足 k 个时全部返回。
+
+    Example:
+        >>> reservoir_sample(map(str, range(1000)), 3, random.Random(1))
+        ['453', '35', '49']
+    """
+    if k <= 0:
+        raise ValueError("k 必须大于 0")
+    iterator: Iterator[str] = iter(items)
+    reservoir: list[str] = list(islice(iterator, k))
+    if len(reservoir) < k:
+        return reservoir
+    # random() 可能返回 0.0，取 1 - random() 保证对数有定义
+    w: float = math.exp(math.log(1.0 - rng.random()) / k)
+    while w < 1.0:
+        skip: int = math.floor(math.log(1.0 - rng.random()) / math.log1p(-w))
+        # 丢弃 skip 个条目，与 itertools 文档中的 consume 相同
+        next(islice(iterator, skip, skip), None)
+        item: str | None = next(iterator, None)
+        if item is None:
+            break
+        reservoir[rng.randrange(k)] = item
+        w *= math.exp(math.log(1.0 - rng.random()) / k)
+    return reservoir
+
+
+def _corpus_format(path: Path, format: CorpusFormat | None) -> CorpusFormat:
+    if format is None:
+        return _SUFFIX_FORMATS.get(path.suffix.lower(), "text")
+    if format not in ("text", "csv", "jsonl"):
+        raise ValueError(f"不支持的语料格式：{format}，可选 text、csv、jsonl")
+    return format
+
+
+def iter_entries(
+    path: str | os.PathLike,
+    format: CorpusFormat | None = None,
+    column: str | int | None = None,
+) -> Iterator[str]:
+    """
+    逐条读取语料文件中的条目，去掉首尾空白，跳过空条目。
+
+    Args:
+        path: UTF-8 编码的语料文件。
+        format: text 为每行一个条目；csv 取 column 列；jsonl 每行为 JSON 字符串，
+            或取 JSON 对象的 column 字段。None 时按扩展名推断。
+        column: csv 的列名（第一行为表头）或从 0 开始的列号，默认为第 0 列；
+            jsonl 中对象的字段名。
+
+    Raises:
+        ValueError: 格式不受支持，或 csv 表头中没有 column 列。
+        TypeError: jsonl 的行既不是字符串，也不能用 column 取出字符串。
+    """
+    path = Path(path)
+    format = _corpus_format(path, format)
+    with path.open(encoding="utf-8", newline="" if format == "csv" else None) as f:
+        if format == "text":
+            for line in f:
+                if value := line.strip():
+                    yield value
+        elif format == "csv":
+            import csv
+
+            reader = csv.reader(f)
+            index: int = 0
+            if isinstance(column, str):
+                header: list[str] = next(reader, [])
+                if column not in header:
+                    raise ValueError(f"{path} 的表头中没有 {column} 列")
+                index = header.index(column)
+            elif column is not None:
+                index = column
+            for row in reader:
+                if len(row) > index and (value := row[index].strip()):
+                    yield value
+        else:
+            import json
+
+            for number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                item = json.loads(line)
+                if isinstance(item, dict) and isinstance(column, str):
+                    item = item.get(column)
+                if item is None:
+                    continue
+                if not isinstance(item, str):
+                    raise TypeError(
+                        f"{path} 第 {number} 行不是字符串，对象需要用 column 指定字段"
+                    )
+                if value := item.strip():
+                    yield value
+
+
+def _cache_path(
+    path: Path, stat: os.stat_result, key: str, cache_dir: Path
+) -> tuple[Path, str, str]:
+    """
+    缓存文件路径，以及同一语料文件的缓存共用的文件名前缀、当前文件内容的缓存共用的前缀。
+
+    文件名为 <路径摘要>-<大小和修改时间摘要>-<抽样参数摘要>.bin，同一文件按不同参数
+    抽取的样本可以同时存在，只有大小或修改时间变化后的缓存才会过期。
+    """
+    from hashlib import blake2b
+
+    def digest(text: str) -> str:
+        return blake2b(text.encode(), digest_size=8).hexdigest()
+
+    source: str = f"{digest(str(path))}-"
+    version: str = f"{source}{digest(f'{stat.st_size}:{stat.st_mtime_ns}')}-"
+    return cache_dir / f"{version}{digest(key)}.bin", source, version
+
+
+def sample_corpus(
+    path: str | os.PathLike,
+    sample_size: int = 10000,
+    format: CorpusFormat | None = None,
+    column: str | int | None = None,
+    cache_dir: str | os.PathLike | None = None,
+) -> Table:
+    """
+    从语料文件中均匀抽取 sample_size 个条目，结果按打包格式缓存。
+
+    缓存以文件的绝对路径、大小、修改时间以及抽样参数为键：文件没有变化时直接映射
+    缓存文件；文件变化后重新抽样，并删除该文件在变化之前的全部缓存。抽样使用由上述键确定的种子，
+    同一份语料总是得到相同的样本。重复的条目合并为一个，权重为其在样本中出现的次数。
+
+    Args:
+        path: 语料文件，格式见 iter_entries。
+        sample_size: 抽取的条目数，语料条目不足时全部保留。
+        format: 语料格式，None 时按扩展名推断。
+        column: csv 的列名或列号，jsonl 中对象的字段名。
+        cache_dir: 缓存目录，默认见 default_cache_dir()。
+
+    Returns:
+        Table: values 为映射自缓存文件的 PackedTable。
+
+    Raises:
+        FileNotFoundError: 语料文件不存在。
+        ValueError: sample_size 小于 1，或语料中没有任何条目。
+
+    Example:
+        >>> table = sample_corpus("addresses.txt", sample_size=100_000)
+        >>> len(table), table.values[0]
+    """
+    if sample_size <= 0:
+        raise ValueError("sample_size 必须大于 0")
+    path = Path(path).resolve()
+    stat: os.stat_result = path.stat()
+    format = _corpus_format(path, format)
+    key: str = f"{sample_size}:{format}:{column!r}"
+    directory = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+    cached, source, version = _cache_path(path, stat, key, directory)
+
+    if not cached.is_file():
+        rng = random.Random(f"{stat.st_size}:{stat.st_mtime_ns}:{key}")
+        sample: list[str] = reservoir_sample(
+            iter_entries(path, format, column), sample_size, rng
+        )
+        if not sample:
+            raise ValueError(f"{path} 中没有任何条目")
+        directory.mkdir(parents=True, exist_ok=True)
+        # 先写入临时文件再改名，并发的进程不会读到写了一半的缓存
+        temporary: Path = cached.with_suffix(f".{os.getpid()}.tmp")
+        temporary.write_bytes(pack(Table.from_items(sample)))
+        os.replace(temporary, cached)
+        # 只删除同一语料文件在大小或修改时间变化之前的缓存，不同抽样参数的缓存保留
+        for stale in directory.glob(f"{source}*.bin"):
+            if stale.name.startswith(version):
+                continue
+            try:
+                stale.unlink()
+            except OSError:
+                # 其他进程仍在映射（Windows 上不能删除），留到下次清理
+                pass
+
+    values = PackedTable(map_file(cached))
+    return Table(values, values.weights)
@@ -0,0 +1,356 @@
+"""
+区域代码相关的索引。
+
+所有索引在第一次使用时由 czo.data 中的数据表构建，之后在模块级缓存。
+区域代码表映射自 czo/data/packed/area.bin，每个条目为 6 位代码加区域全称。
+"""
+
+from bisect import bisect_left
+from collections.abc import Iterator
+from functools import cache
+
+
+class AreaCodeIndex:
+    """
+    按省（前 2 位）、市（前 4 位）、区县（6 位）分组的区域代码索引。
+
+    每个分组是一个元组，按分组随机抽取区域代码只需一次下标访问，不需要扫描全部代码。
+    """
+
+    __slots__ = ("by_city", "by_province", "codes", "names")
+
+    def __init__(self, names: dict[str, str]) -> None:
+        self.names: dict[str, str] = names
+        self.codes: tuple[str, ...] = tuple(names)
+
+        by_province: dict[str, list[str]] = {}
+        by_city: dict[str, list[str]] = {}
+        for code in self.codes:
+            by_province.setdefault(code[:2], []).append(code)
+            by_city.setdefault(code[:4], []).append(code)
+        self.by_province: dict[str, tuple[str, ...]] = {
+            prefix: tuple(codes) for prefix, codes in by_province.items()
+        }
+        self.by_city: dict[str, tuple[str, ...]] = {
+            prefix: tuple(codes) for prefix, codes in by_city.items()
+        }
+
+    def select(
+        self,
+        province: str | None = None,
+        city: str | None = None,
+        district: str | None = None,
+    ) -> tuple[str, ...]:
+        """
+        返回满足条件的区域代码，条件都为 None 时返回全部代码。
+
+        Args:
+            province: 省级代码前 2 位，例如 "33"。
+            city: 市级代码前 4 位，例如 "3301"。
+            district: 完整的 6 位区域代码，例如 "330108"。
+
+        Raises:
+            ValueError: 区域代码不存在，或多个条件互相矛盾。
+        """
+        if district is not None:
+            if district not in self.names:
+                raise ValueError(f"未知的区域代码：{district}")
+            if (city is not None and not district.startswith(city)) or (
+                province is not None and not district.startswith(province)
+            ):
+                raise ValueError(f"区域代码 {district} 不属于指定的省或市")
+            return (district,)
+
+        if city is not None:
+            if city not in self.by_city:
+                raise ValueError(f"未知的市级代码：{city}")
+            if province is not None and not city.startswith(province):
+                raise ValueError(f"市级代码 {city} 不属于省级代码 {province}")
+            return self.by_city[city]
+
+        if province is not None:
+            if province not in self.by_province:
+                raise ValueError(f"未知的省级代码：{province}")
+            return self.by_province[province]
+
+        return self.codes
+
+
+@cache
+def area_names() -> dict[str, str]:
+    """6 位区域代码到区域全称的映射，按代码顺序排列"""
+    from ._table import open_packed
+
+    return {entry[:6]: entry[6:] for entry in open_packed("area").values}
+
+
+@cache
+def area_index() -> AreaCodeIndex:
+    """全部区域代码的索引，只在第一次使用时构建"""
+    return AreaCodeIndex(area_names())
+
+
+# 区域层级，从上到下
+LEVELS: tuple[str, ...] = ("province", "city", "district")
+
+
+def _level(code: str) -> str:
+    """6 位区域代码的层级：以 0000 结尾为省级，以 00 结尾为市级，其余为区县级"""
+    if code.endswith("0000"):
+        return "province"
+    if code.endswith("00"):
+        return "city"
+    return "district"
+
+
+class RegionTree:
+    """
+    省 → 市 → 区县的区域树，父节点和子节点都预先算好，查询只需一次字典访问。
+
+    节点用 6 位区域代码表示；查询时也接受 2 位省级代码和 4 位市级代码，例如 "33"、"3301"。
+    区县的市级代码不存在时直接挂在省下。
+    """
+
+    __slots__ = ("_children", "_parents", "_within", "names")
+
+    def __init__(self, names: dict[str, str]) -> None:
+        self.names: dict[str, str] = names
+
+        parents: dict[str, str | None] = {}
+        children: dict[str | None, list[str]] = {None: []}
+        for code in names:
+            parent: str | None = None
+            if not code.endswith("0000"):
+                city: str = f"{code[:4]}00"
+                province: str = f"{code[:2]}0000"
+                if not code.endswith("00") and city in names:
+                    parent = city
+                elif province in names:
+                    parent = province
+            parents[code] = parent
+            children.setdefault(code, [])
+            children[parent].append(code)
+
+        # 每个节点（None 表示根）之下各层级的全部节点，按层级随机抽取只需一次下标访问
+        within: dict[tuple[str | None, str], list[str]] = {}
+        for code in names:
+            level: str = _level(code)
+            node: str | None = code
+            while node is not None:
+                within.setdefault((node, level), []).append(code)
+                node = parents[node]
+            within.setdefault((None, level), []).append(code)
+
+        self._parents: dict[str, str | None] = parents
+        self._children: dict[str | None, tuple[str, ...]] = {
+            code: tuple(codes) for code, codes in children.items()
+        }
+        self._within: dict[tuple[str | None, str], tuple[str, ...]] = {
+            key: tuple(codes) for key, codes in within.items()
+        }
+
+    def _node(self, code: str) -> str:
+        """把 2 位、4 位或 6 位的区域代码规范成树中的 6 位代码"""
+        node: str = code.ljust(6, "0") if len(code) in (2, 4) else code
+        if node not in self.names:
+            raise ValueError(f"未知的区域代码：{code}")
+        return node
+
+    def parent(self, code: str) -> str | None:
+        """上一级区域的代码，省级区域返回 None"""
+        return self._parents[self._node(code)]
+
+    def children(self, code: str | None = None) -> tuple[str, ...]:
+        """下一级区域的代码，code 为 None 时返回全部省级区域"""
+        return self._children[None if code is None else self._node(code)]
+
+    def full_name(self, code: str) -> str:
+        """区域的全称，例如 330108 为 浙江省杭州市滨江区"""
+        return self.names[self._node(code)]
+
+    def level(self, code: str) -> str:
+        """区域的层级：province、city 或 district"""
+        return _level(self._node(code))
+
+    def select(
+        self, level: str = "district", under: str | None = None
+    ) -> tuple[str, ...]:
+        """
+        under 范围内（包括 under 本身）层级为 level 的全部区域代码。
+
+        Args:
+            level: province、city 或 district。
+            under: 限定范围的区域代码，为 None 时不限。
+
+        Raises:
+            ValueError: 层级未知、区域代码不存在，或范围内没有该层级的区域。
+        """
+        if level not in LEVELS:
+            raise ValueError(f"未知的区域层级：{level}，可选 {'、'.join(LEVELS)}")
+        node: str | None = None if under is None else self._node(under)
+        codes: tuple[str, ...] | None = self._within.get((node, level))
+        if codes is None:
+            raise ValueError(f"区域 {under} 内没有 {level} 级区域")
+        return codes
+
+
+@cache
+def region_tree() -> RegionTree:
+    """全部区域代码的区域树，只在第一次使用时构建"""
+    return RegionTree(area_names())
+
+
+class RegionNames:
+    """
+    区域名称到区域代码的反向索引，支持精确查找、最长前缀匹配和按前缀枚举。
+
+    除全称（例如 "浙江省杭州市滨江区"）外，还收录去掉省级名称后的名称（例如 "杭州市滨江区"）。
+    同一个名称可能对应多个区域（例如 "市辖区"），查询结果是代码元组，全称对应的代码排在前面。
+
+    精确查找和最长前缀匹配只做与名称长度成正比次数的字典访问，与区域数量无关；
+    按前缀枚举在排序后的名称上二分查找起点，之后逐个产出。
+    """
+
+    __slots__ = ("_codes", "_keys", "_longest")
+
+    def __init__(self, names: dict[str, str], aliases: bool = True) -> None:
+        codes: dict[str, list[str]] = {}
+        for code, name in names.items():
+            codes.setdefault(name, []).append(code)
+        if aliases:
+            for code, name in names.items():
+                province: str | None = names.get(f"{code[:2]}0000")
+                if province and name.startswith(province):
+                    alias: str = name[len(province) :]
+                    if len(alias) >= 2:
+                        codes.setdefault(alias, []).append(code)
+        self._codes: dict[str, tuple[str, ...]] = {
+            name: tuple(dict.fromkeys(values)) for name, values in codes.items()
+        }
+        self._keys: tuple[str, ...] = tuple(sorted(self._codes))
+        self._longest: int = max(map(len, self._keys))
+
+    def get(self, name: str) -> tuple[str, ...]:
+        """与 name 完全相同的区域名称对应的代码，没有时返回空元组"""
+        return self._codes.get(name, ())
+
+    def longest_prefix(self, text: str) -> tuple[str, tuple[str, ...]] | None:
+        """
+        text 开头最长的区域名称及其代码，没有时返回 None。
+
+        Example:
+            >>> region_names().longest_prefix("杭州市滨江区长河街道泰安路9号")
+            ('杭州市滨江区', ('330108',))
+        """
+        codes = self._codes
+        for end in range(min(len(text), self._longest), 0, -1):
+            found: tuple[str, ...] | None = codes.get(text[:end])
+            if found is not None:
+                return text[:end], found
+        return None
+
+    def startswith(self, prefix: str) -> Iterator[tuple[str, tuple[str, ...]]]:
+        """按名称顺序产出以 prefix 开头的全部区域名称及其代码，用于自动补全"""
+        keys, codes = self._keys, self._codes
+        for i in range(bisect_left(keys, prefix), len(keys)):
+            if not keys[i].startswith(prefix):
+                break
+            yield keys[i], codes[keys[i]]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+@cache
+def region_names() -> RegionNames:
+    """全部区域名称的反向索引，只在第一次使用时构建"""
+    return RegionNames(area_names())
+
+
+def _group(codes_and_values: list[tuple[str, str]], width: int) -> dict:
+    """按区域代码前 width 位分组，每组是一个元组"""
+    groups: dict[str, list[str]] = {}
+    for code, value in codes_and_values:
+        groups.setdefault(code[:width], []).append(value)
+    return {prefix: tuple(values) for prefix, values in groups.items()}
+
+
+class AddressIndex:
+    """
+    按区域代码分组的地址和座机区号索引，用于生成区域一致的地址、座机号和身份证号。
+
+    地址条目按最长前缀匹配区域名称（例如 "浙江省杭州市滨江区" 对应 330108），
+    匹配到区县、市或省时分别归入对应的分组，匹配不到区域的条目（例如只有小区名的住宅）
+    不进入索引。座机区号按 landline_prefix_provinces 的最长前缀归入省份。
+    """
+
+    __slots__ = (
+        "by_area",
+        "by_city",
+        "by_code",
+        "by_province",
+        "landlines",
+    )
+
+    def __init__(
+        self,
+        names: dict[str, str],
+        entries: list[str],
+        landline_prefixes: list[str],
+        landline_provinces: dict[str, str],
+    ) -> None:
+        # 只按全称匹配，同名的区域取第一个代码
+        region_names = RegionNames(names, aliases=False)
+        located: list[tuple[str, str]] = []
+        for entry in dict.fromkeys(entries):
+            match = region_names.longest_prefix(entry)
+            if match is not None and len(match[0]) >= 2:
+                located.append((match[1][0], entry))
+
+        self.by_area: dict[str, tuple[str, ...]] = _group(located, 6)
+        self.by_city: dict[str, tuple[str, ...]] = _group(located, 4)
+        self.by_province: dict[str, tuple[str, ...]] = _group(located, 2)
+        # 每个区域代码范围内的地址，只保留非空的分组，按身份证区域查找时只需一次字典访问
+        self.by_code: dict[str, tuple[str, ...]] = {
+            code: addresses for code in names if (addresses := self.addresses(code))
+        }
+
+        provinces: list[tuple[str, str]] = []
+        for prefix in landline_prefixes:
+            for end in range(len(prefix), 0, -1):
+                if prefix[:end] in landline_provinces:
+                    provinces.append((landline_provinces[prefix[:end]], prefix))
+                    break
+        self.landlines: dict[str, tuple[str, ...]] = _group(provinces, 2)
+
+    def addresses(self, code: str) -> tuple[str, ...]:
+        """
+        区域代码 code 范围内的地址条目，没有时返回空元组。
+
+        code 为 2 位时按省、4 位时按市查找；6 位的代码如果以 0000 或 00 结尾，
+        表示整个省或市。
+        """
+        if len(code) == 6:
+            if code.endswith("0000"):
+                code = code[:2]
+            elif code.endswith("00"):
+                code = code[:4]
+            else:
+                return self.by_area.get(code, ())
+        if len(code) == 4:
+            return self.by_city.get(code, ())
+        return self.by_province.get(code, ())
+
+
+@cache
+def address_index() -> AddressIndex:
+    """地址和座机区号的区域索引，只在第一次使用时构建"""
+    from ..data._data import landline_number_prefix, landline_prefix_provinces
+    from ._table import open_packed
+
+    return AddressIndex(
+        area_names(),
+        [*open_packed("address").values, *open_packed("residence").values],
+        landline_number_prefix,
+        landline_prefix_provinces,
+    )
@@ -0,0 +1,143 @@
+"""
+按名称注册的数据集，加载函数只在第一次使用时运行一次，结果在进程内缓存。
+
+在 fork 子进程之前预加载，子进程可以通过写时复制直接共享已加载的数据，
+不需要各自重新导入 czo.data 中的大型数据模块。
+"""
+
+import sys
+import threading
+import types
+from collections.abc import Callable, Iterable
+from typing import Any
+
+# deep_sizeof 不计入的对象：它们属于代码而不是数据
+_UNSIZED: tuple[type, ...] = (
+    type,
+    types.ModuleType,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.MethodType,
+)
+
+
+def deep_sizeof(obj: Any, seen: set[int] | None = None) -> int:
+    """
+    obj 及其引用的全部对象占用的字节数，同一个对象只计算一次。
+
+    递归进入列表、元组、集合、字典，以及对象的 __dict__ 和 __slots__；
+    类、函数和模块不计入。
+    """
+    if seen is None:
+        seen = set()
+    stack: list[Any] = [obj]
+    total: int = 0
+    while stack:
+        item = stack.pop()
+        if id(item) in seen or isinstance(item, _UNSIZED):
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+        if isinstance(item, (str, bytes, int, float, bool)) or item is None:
+            continue
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        else:
+            if hasattr(item, "__dict__"):
+                stack.append(vars(item))
+            for cls in type(item).__mro__:
+                for slot in getattr(cls, "__slots__", ()):
+                    if hasattr(item, slot):
+                        stack.append(getattr(item, slot))
+    return total
+
+
+class Registry:
+    """数据集名称到加载函数的注册表"""
+
+    def __init__(self) -> None:
+        self._loaders: dict[str, Callable[[], Any]] = {}
+        self._data: dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str) -> Callable[[Callable[[], Any]], Callable[[], Any]]:
+        """
+        注册数据集加载函数的装饰器，重复注册同一名称会替换之前的加载函数并丢弃缓存。
+
+        Example:
+            >>> @providers.register("city")
+            ... def _load_city():
+            ...     return ["杭州", "宁波"]
+        """
+
+        def decorator(loader: Callable[[], Any]) -> Callable[[], Any]:
+            with self._lock:
+                self._loaders[name] = loader
+                self._data.pop(name, None)
+            return loader
+
+        return decorator
+
+    def __getitem__(self, name: str) -> Any:
+        try:
+            return self._data[name]
+        except KeyError:
+            return self.load(name)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._loaders
+
+    def load(self, name: str) -> Any:
+        """返回数据集，第一次使用时运行加载函数"""
+        with self._lock:
+            if name in self._data:
+                return self._data[name]
+            loader = self._loaders.get(name)
+        if loader is None:
+            raise KeyError(f"未注册的数据集：{name}")
+        # 加载函数可能依赖其他数据集，在锁外运行，避免重入时死锁
+        data = loader()
+        with self._lock:
+            return self._data.setdefault(name, data)
+
+    def preload(self, names: Iterable[str] | None = None) -> None:
+        """预加载指定的数据集，names 为 None 时预加载全部"""
+        for name in list(self._loaders) if names is None else names:
+            self.load(name)
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        """已注册的数据集名称"""
+        return tuple(self._loaders)
+
+    @property
+    def loaded(self) -> tuple[str, ...]:
+        """已加载的数据集名称"""
+        return tuple(self._data)
+
+    def footprint(self) -> dict[str, int]:
+        """
+        已加载的各数据集占用的内存字节数（包括其引用的全部字符串等对象）。
+
+        各数据集分别计算，多个数据集共享的对象在每个数据集中都会计入。
+
+        Example:
+            >>> providers.preload()
+            >>> providers.footprint()
+            {'address': 21576, 'residence': 33390, ...}
+        """
+        return {name: deep_sizeof(data) for name, data in list(self._data.items())}
+
+    def discard(self, *names: str) -> None:
+        """丢弃指定数据集的缓存，下次使用时重新加载"""
+        with self._lock:
+            for name in names:
+                self._data.pop(name, None)
+
+    def clear(self) -> None:
+        """丢弃全部缓存，下次使用时重新加载"""
+        with self._lock:
+            self._data.clear()
@@ -0,0 +1,106 @@
+"""
+把打包的内置数据集放入 multiprocessing.shared_memory，供工作进程零拷贝使用。
+
+spawn 或 forkserver 启动的工作进程不继承父进程已加载的数据，每个进程都要重新打开数据文件；
+父进程用 share_datasets 把各数据集的打包内容复制到共享内存一次，工作进程在初始化时调用
+attach，之后 open_packed 直接在共享内存上构建 PackedTable，所有进程使用同一份物理内存。
+
+数据文件在普通目录中时 open_packed 本来就用 mmap 映射，各进程共用页缓存，使用共享内存
+不会减少常驻内存，导入 shared_memory 还会让每个进程多占约 1 MB；它只在数据文件不能映射
+（例如从 zip 导入，每个进程各自读入一份）时才节省内存。
+"""
+
+import sys
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager, suppress
+from multiprocessing import shared_memory
+from typing import NamedTuple
+
+from ._table import PACKED_NAMES, open_packed, use_buffers
+
+
+class _AttachedMemory(shared_memory.SharedMemory):
+    """工作进程打开的共享内存，PackedTable 一直引用到进程退出"""
+
+    def __del__(self) -> None:
+        # 进程退出时仍有 memoryview 引用缓冲区，close 会抛出 BufferError，映射随进程释放
+        with suppress(BufferError):
+            super().__del__()
+
+
+# attach 打开的共享内存，工作进程退出前需要一直保持引用
+_attached: list[_AttachedMemory] = []
+
+
+class SharedDatasets(NamedTuple):
+    """
+    共享内存中的数据集，可以 pickle 后作为进程池 initializer 的参数传给工作进程。
+
+    blocks 中每一项为（数据集名称，共享内存名称，打包内容的字节数）。
+    """
+
+    blocks: tuple[tuple[str, str, int], ...]
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        """已共享的数据集名称"""
+        return tuple(name for name, _, _ in self.blocks)
+
+    @property
+    def nbytes(self) -> int:
+        """共享内存中打包内容的总字节数"""
+        return sum(size for _, _, size in self.blocks)
+
+
+def _open(name: str) -> _AttachedMemory:
+    """打开已有的共享内存；Python 3.13 起不交给 resource_tracker，由创建者负责释放"""
+    if sys.version_info >= (3, 13):
+        return _AttachedMemory(name=name, track=False)
+    return _AttachedMemory(name=name)
+
+
+def attach(datasets: SharedDatasets) -> None:
+    """
+    在工作进程中使用共享内存中的数据集，之后 open_packed 不再读取数据文件。
+
+    应在使用任何数据集之前调用，通常作为进程池的 initializer。
+    """
+    buffers: dict[str, memoryview] = {}
+    for name, block, size in datasets.blocks:
+        memory = _open(block)
+        _attached.append(memory)
+        # 共享内存按页对齐，可能比打包内容长
+        buffers[name] = memory.buf[:size]
+    use_buffers(buffers)
+
+
+@contextmanager
+def share_datasets(
+    names: Iterable[str] = PACKED_NAMES,
+) -> Iterator[SharedDatasets]:
+    """
+    把 names 中的打包数据集复制到共享内存，退出时释放。
+
+    Args:
+        names: 数据集名称，默认为全部内置打包数据集（见 PACKED_NAMES）。
+
+    Example:
+        >>> with share_datasets() as datasets:
+        ...     with ProcessPoolExecutor(initializer=attach, initargs=(datasets,)) as pool:
+        ...         ...
+    """
+    created: list[shared_memory.SharedMemory] = []
+    blocks: list[tuple[str, str, int]] = []
+    try:
+        for name in names:
+            buffer = open_packed(name).values.buffer
+            size: int = len(buffer)
+            memory = shared_memory.SharedMemory(create=True, size=size)
+            created.append(memory)
+            memory.buf[:size] = buffer
+            blocks.append((name, memory.name, size))
+        yield SharedDatasets(tuple(blocks))
+    finally:
+        for memory in created:
+            memory.close()
+            memory.unlink()
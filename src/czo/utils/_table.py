@@ -0,0 +1,216 @@
+"""
+去重后的数据表，以及内置数据集的打包格式。
+
+czo.data 中的取值表加载时按首次出现的顺序去重，random.choice 不会偏向重复的条目；
+条目可以写成 (取值, 权重) 表示出现频率，权重只在 Faker(weighted=True) 按频率抽样时使用。
+
+常用的大型数据集由 python -m czo.data._build 预先打包成 czo/data/packed/<名称>.bin，
+文件结构（小端序）：
+
+    头部     b"CZOT"、格式版本、条目数 n，各 4 字节
+    偏移表   n + 1 个 uint32（array("I")），第 i 个条目为 blob[offsets[i]:offsets[i + 1]]
+    权重     n 个 uint32
+    blob     全部条目的 UTF-8 编码首尾相接
+
+加载时用 mmap 映射整个文件，不为每个条目创建 str 对象，按下标访问时只解码被选中的条目。
+多进程生成时也可以由 czo.utils._shared 放入共享内存，工作进程通过 use_buffers 直接使用。
+"""
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from functools import cache
+from typing import Any, overload
+
+_MAGIC: bytes = b"CZOT"
+_FORMAT_VERSION: int = 1
+_HEADER = struct.Struct("<4sII")
+
+# 打包的内置数据集名称，与 czo.data._build.SOURCES 一致
+PACKED_NAMES: tuple[str, ...] = (
+    "address",
+    "store_name",
+    "residence",
+    "area",
+    "country_zh",
+    "country_en",
+)
+
+# use_buffers 指定的缓冲区，open_packed 优先使用，不再映射文件
+_buffers: dict[str, bytes | memoryview] = {}
+
+
+class Table:
+    """按首次出现顺序去重的字符串表，weights[i] 为 values[i] 的权重"""
+
+    __slots__ = ("values", "weights")
+
+    def __init__(self, values: Iterable[str], weights: Iterable[int]) -> None:
+        # PackedTable 等序列直接使用，不复制成元组
+        self.values: Sequence[str] = (
+            values if isinstance(values, Sequence) else tuple(values)
+        )
+        self.weights: Sequence[int] = (
+            weights if isinstance(weights, Sequence) else tuple(weights)
+        )
+        if len(self.values) != len(self.weights):
+            raise ValueError("取值和权重必须一一对应")
+
+    @classmethod
+    def from_items(cls, items: Iterable[str | tuple[str, int]]) -> "Table":
+        """
+        由可能重复的条目构建，重复的条目只保留一个并驻留（sys.intern）。
+
+        条目为字符串时权重为 1，为 (取值, 权重) 时使用给定的权重；重复条目的权重相加。
+
+        Example:
+            >>> table = Table.from_items(["潮悦汇", ("月明盲人推拿", 3), "潮悦汇"])
+            >>> table.values, table.weights
+            (('潮悦汇', '月明盲人推拿'), (2, 3))
+        """
+        weights: dict[str, int] = {}
+        for item in items:
+            value, weight = (item, 1) if isinstance(item, str) else item
+            if weight < 0:
+                raise ValueError(f"权重不能为负数：{value}")
+            value = sys.intern(value)
+            weights[value] = weights.get(value, 0) + weight
+        return cls(weights.keys(), weights.values())
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self.values)} 条)"
+
+
+def pack(table: Table) -> bytes:
+    """把 Table 编码成打包格式"""
+    encoded: list[bytes] = [value.encode("utf-8") for value in table.values]
+    offsets = array("I", [0])
+    for data in encoded:
+        offsets.append(offsets[-1] + len(data))
+    weights = array("I", table.weights)
+    if sys.byteorder == "big":
+        offsets.byteswap()
+        weights.byteswap()
+    header: bytes = _HEADER.pack(_MAGIC, _FORMAT_VERSION, len(encoded))
+    return b"".join([header, offsets.tobytes(), weights.tobytes(), *encoded])
+
+
+class PackedTable(Sequence):
+    """
+    打包格式的只读字符串序列，可以直接用于 random.choice 和 random.choices。
+
+    buffer 可以是 mmap、bytes 或 memoryview；偏移表和权重直接在 buffer 上按 uint32 读取，不复制。
+    """
+
+    __slots__ = ("_blob", "_buffer", "_count", "_offsets", "weights")
+
+    def __init__(self, buffer: bytes | memoryview | mmap.mmap) -> None:
+        if len(buffer) < _HEADER.size:
+            raise ValueError("不是 czo 打包数据表")
+        magic, version, count = _HEADER.unpack_from(buffer)
+        if magic != _MAGIC or version != _FORMAT_VERSION:
+            raise ValueError("不是 czo 打包数据表，或格式版本不受支持")
+        start: int = _HEADER.size
+        end: int = start + 4 * (2 * count + 1)
+        if array("I").itemsize != 4 or len(buffer) < end:
+            raise ValueError("打包数据表已损坏")
+        if sys.byteorder == "little":
+            view = memoryview(buffer)[start:end].cast("I")
+        else:
+            view = array("I", buffer[start:end])
+            view.byteswap()
+        self._buffer: bytes | memoryview | mmap.mmap = buffer
+        self._count: int = count
+        self._offsets: Sequence[int] = view[: count + 1]
+        self.weights: Sequence[int] = view[count + 1 :]
+        self._blob: int = end
+
+    @property
+    def buffer(self) -> bytes | memoryview | mmap.mmap:
+        """打包格式的完整内容"""
+        return self._buffer
+
+    def __len__(self) -> int:
+        return self._count
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+    def __getitem__(self, index: Any) -> str | list[str]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("PackedTable 下标越界")
+        offsets, blob = self._offsets, self._blob
+        return str(
+            self._buffer[blob + offsets[index] : blob + offsets[index + 1]], "utf-8"
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        buffer, blob, offsets = self._buffer, self._blob, self._offsets
+        for i in range(self._count):
+            yield str(buffer[blob + offsets[i] : blob + offsets[i + 1]], "utf-8")
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._count} 条)"
+
+
+def population(values: Sequence[str], k: int) -> Sequence[str]:
+    """
+    从 values 中抽取 k 次时使用的序列。
+
+    values 为 PackedTable 且 k 不少于条目数时先整体解码成列表，每个条目只解码一次，
+    否则直接使用 values，只解码被抽中的条目。
+    """
+    if isinstance(values, PackedTable) and k >= len(values):
+        return list(values)
+    return values
+
+
+def map_file(path: str | os.PathLike) -> mmap.mmap:
+    """只读映射整个文件，文件关闭后映射仍然有效"""
+    with open(path, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def use_buffers(buffers: dict[str, bytes | memoryview]) -> None:
+    """之后 open_packed(name) 直接使用 buffers[name] 中的打包内容，不再读取文件"""
+    _buffers.update(buffers)
+    open_packed.cache_clear()
+
+
+@cache
+def open_packed(name: str) -> Table:
+    """
+    加载 czo/data/packed/<name>.bin，每个进程只映射一次。
+
+    安装在普通目录中时用 mmap 映射文件，多个进程共享同一份页缓存；
+    从 zip 等不能映射的位置导入时读入内存。use_buffers 指定了缓冲区时直接使用。
+
+    Returns:
+        Table: values 为 PackedTable，weights 为打包时保存的权重。
+    """
+    buffer: bytes | memoryview | mmap.mmap | None = _buffers.get(name)
+    if buffer is None:
+        path: str = os.path.join(
+            os.path.dirname(__file__), "..", "data", "packed", f"{name}.bin"
+        )
+        try:
+            buffer = map_file(path)
+        except FileNotFoundError:
+            # 不在普通目录中（例如从 zip 导入），通过 importlib.resources 读入内存
+            from importlib.resources import files
+
+            packed = files("czo.data").joinpath("packed", f"{name}.bin")
+            buffer = packed.read_bytes()
+    values = PackedTable(buffer)
+    return Table(values, values.weights)
@@ -1,4 +1,3 @@
-import ipaddress
 from typing import Any, Generator, Union
 
 from . import add_help
@@ -27,6 +26,7 @@ class Net:
 
         >>> print(NetworkUtils.parse_cidr('240e::0', 64))
         """
+        import ipaddress
 
         v4 = ipaddress.IPv4Network
         v6 = ipaddress.IPv6Network
@@ -78,6 +78,8 @@ class Net:
         >>> ip_list = [ip for sublist in NetLib.ipaddress_generator(10, a=100) for ip in sublist]
 
         """
+        import ipaddress
+
         a: int = kwargs.get("a", 1)
         b: int = kwargs.get("b", 1)
         c: int = kwargs.get("c", 1)
@@ -195,6 +197,8 @@ class Net:
         >>> print(NetLib.generate_ip_list(3, is_ipv6=True, ip_str="2001:db8::1"))
 
         """
+        import ipaddress
+
         if is_ipv6:
             if ip_str is None:
                 ipv6 = int(ipaddress.ip_address("2001:db8:0:42:0:8a2e:370:1"))
@@ -238,6 +242,8 @@ class Net:
         - ip_in_range("2a00::110:1", "2a00::110:0/116")
         - ip_in_range("2a00::110:1", "2a00::110:1-2a00::110:fff")
         """
+        import ipaddress
+
         ip = ipaddress.ip_address(ip_str)
 
         if subnet_str and "/" in subnet_str:
@@ -316,4 +322,6 @@ class Net:
         >>> NetLib.cidr_to_subnet(24)
         '255.255.255.0'
         """
+        import ipaddress
+
         return str(ipaddress.IPv4Network(f"0.0.0.0/{cidr}").netmask)
@@ -1,5 +1,4 @@
 import os
-import shutil
 import sys
 from pathlib import Path
 
@@ -23,6 +22,8 @@ class Paths:
         Args:
             path:要清空的目录
         """
+        import shutil
+
         if not os.path.exists(path):
             sys.exit("要清空的目录不存在")
 
@@ -51,6 +52,7 @@ class Paths:
             >>> del_key_directory('C:/Users/user/Documents', ['example', 'test'])
             >>> del_key_directory('C:/Users/user/Documents', ['example', 'test'], confirm=True)
         """
+        import shutil
 
         keys = []
 
@@ -216,6 +218,7 @@ class Paths:
 
         - remove_empty_dirs：设置为 True 时，移动完文件后删除原目录（前提是目录为空）；设置为 False 时不删除目录。
         """
+        import shutil
 
         # 定义视频文件格式
         video_extensions = {".mp4", ".mkv", ".avi", ".mov", ".flv", ".wmv", ".webm"}
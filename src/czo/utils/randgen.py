@@ -1,12 +1,9 @@
-import hashlib
-import ipaddress
 import random
-import secrets
-import shutil
 import string
-import uuid
+from collections.abc import AsyncIterator
 
 from . import add_help
+from ._aio import aiter_batches
 
 
 @add_help
@@ -18,6 +15,43 @@ class Rand:
     @staticmethod
     def help() -> None: ...
 
+    @staticmethod
+    def agenerate(
+        method: str, n: int, batch: int = 1000, prefetch: int = 2, **kwargs
+    ) -> AsyncIterator[list]:
+        """
+        异步分批调用 n 次 Rand 的 method 方法，供 asyncio 程序使用。
+
+        每批在后台线程中生成，事件循环只等待已经生成好的批次；
+        最多提前生成 prefetch 批，消费者处理得慢时后台线程随之停下。
+
+        Args:
+            method: Rand 的方法名，例如 "random_ip"。
+            n: 生成的数据总数。
+            batch: 每批的数量，最后一批可能不足 batch。
+            prefetch: 最多提前生成的批数。
+            **kwargs: 传给 method 的参数。
+
+        Returns:
+            AsyncIterator[list]: 每次产出一批数据。
+
+        Example:
+            >>> async for ips in Rand.agenerate("random_ip", 10000, batch=100, v6=True):
+            ...     await client.send(ips)
+        """
+        if method.startswith("_") or method in ("help", "agenerate"):
+            raise ValueError(f"不支持的 Rand 方法：{method}")
+        func = getattr(Rand, method, None)
+        if func is None:
+            raise ValueError(f"不支持的 Rand 方法：{method}")
+        if not callable(func):
+            raise TypeError(f"Rand 的 {method} 不是方法")
+
+        def produce(size: int) -> list:
+            return [func(**kwargs) for _ in range(size)]
+
+        return aiter_batches(produce, n, batch, prefetch)
+
     @staticmethod
     def random_file(data: str | None = None) -> tuple:
         """
@@ -41,6 +75,9 @@ class Rand:
             print(result)  # 输出: ("./file", "a1b2c3d4e5f6...")
             ```
         """
+        import hashlib
+        import shutil
+        import uuid
 
         rand_str: list[str] = random.sample(string.ascii_letters + string.digits, 20)
         random_value: str = "".join(rand_str) + "\n" + str(uuid.uuid4())
@@ -60,6 +97,8 @@ class Rand:
     @staticmethod
     def random_int(length: int = 1) -> int:
         """生成随机数"""
+        import secrets
+
         return int("".join(str(secrets.randbelow(10)) for _ in range(length)))
 
     @staticmethod
@@ -102,6 +141,8 @@ class Rand:
         Returns:
         - str: 生成的MD5哈希字符串。根据`len`参数可能被截断。
         """
+        import hashlib
+
         rand: str = "".join(random.sample(string.printable, 10))
         return hashlib.md5(rand.encode()).hexdigest()[:len]
 
@@ -116,6 +157,9 @@ class Rand:
         Returns:
         - str: 根据指定长度生成的哈希字符串。
         """
+        import hashlib
+        import uuid
+
         return hashlib.md5(uuid.uuid4().bytes).hexdigest()[:len]
 
     @staticmethod
@@ -129,6 +173,8 @@ class Rand:
         Returns:
         - str: 生成的IP地址。
         """
+        import ipaddress
+
         if v6:
             return ipaddress.IPv6Address(random.randint(0, 2**128 - 1)).compressed
         else:
@@ -0,0 +1,118 @@
+"""
+基于 NumPy 的批量数值字段生成。
+
+安装 NumPy（``pip install czo[numpy]``）后，Vectorized 的每个方法一次生成 n 个值，
+返回 NumPy 数组；字符串字段返回定长数组（ASCII 为 ``S`` 类型，可以直接
+``tofile``/``tobytes`` 写入磁盘）。未安装 NumPy 时退回到 Faker 的逐条生成，返回列表。
+"""
+
+from typing import Any
+
+from .utils import add_help
+from .utils.faker import (
+    _PHONE_PREFIX_NUMBERS,
+    _PLATE_CHARS,
+    _PLATE_PROVINCES,
+    Faker,
+)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - 取决于运行环境
+    np = None
+
+HAS_NUMPY: bool = np is not None
+
+_HEX_DIGITS = b"0123456789abcdef"
+_UPPERCASE = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+def _code_points(chars: str) -> Any:
+    """字符串中每个字符的 Unicode 码位数组"""
+    return np.array([ord(c) for c in chars], dtype="<u4")
+
+
+@add_help
+class Vectorized:
+    """一次生成一整列数值字段，安装 NumPy 时返回数组，否则退回到逐条生成"""
+
+    def __init__(self, seed: int | None = None) -> None:
+        """
+        Args:
+            seed: 随机种子。相同种子生成相同的数据；为 None 时使用系统熵源。
+        """
+        self._faker: Faker = Faker(seed)
+        self._rng = np.random.default_rng(seed) if HAS_NUMPY else None
+
+    @staticmethod
+    def help() -> None: ...
+
+    def phone_number(self, n: int) -> Any:
+        """手机号，int64 数组"""
+        if self._rng is None:
+            return [self._faker.phone_number() for _ in range(n)]
+        prefixes = np.array(_PHONE_PREFIX_NUMBERS, dtype=np.int64)
+        return prefixes[self._rng.integers(0, len(prefixes), n)] * 100000000 + (
+            self._rng.integers(0, 100000000, n, dtype=np.int64)
+        )
+
+    def age(self, n: int, min: int = 16, max: int = 101) -> Any:
+        """年龄，[min, max] 范围内的整数数组"""
+        if self._rng is None:
+            return [self._faker.age(min, max) for _ in range(n)]
+        return self._rng.integers(min, max + 1, n)
+
+    def latitude(self, n: int) -> Any:
+        """纬度，[-90, 90] 范围内保留 6 位小数的 float64 数组"""
+        return self.__uniform(n, 90.0)
+
+    def longitude(self, n: int) -> Any:
+        """经度，[-180, 180] 范围内保留 6 位小数的 float64 数组"""
+        return self.__uniform(n, 180.0)
+
+    def __uniform(self, n: int, bound: float) -> Any:
+        if self._rng is None:
+            uniform = self._faker._random.uniform
+            return [round(uniform(-bound, bound), 6) for _ in range(n)]
+        return np.round(self._rng.uniform(-bound, bound, n), 6)
+
+    def mac_address(self, n: int, symbol: str = ":") -> Any:
+        """MAC 地址，S17 定长字节数组"""
+        if self._rng is None:
+            return [self._faker.mac_address(symbol) for _ in range(n)]
+        parts = self._rng.integers(0, 256, (n, 6), dtype=np.uint8)
+        hex_digits = np.frombuffer(_HEX_DIGITS, dtype=np.uint8)
+        out = np.full((n, 17), ord(symbol), dtype=np.uint8)
+        out[:, 0::3] = hex_digits[parts >> 4]
+        out[:, 1::3] = hex_digits[parts & 0x0F]
+        return out.view("S17").ravel()
+
+    def passport_number(self, n: int) -> Any:
+        """护照号，S9 定长字节数组"""
+        if self._rng is None:
+            return [self._faker.passport_number() for _ in range(n)]
+        out = np.empty((n, 9), dtype=np.uint8)
+        out[:, 0] = ord("D")
+        out[:, 1:] = self._rng.integers(ord("0"), ord("9") + 1, (n, 8), dtype=np.uint8)
+        return out.view("S9").ravel()
+
+    def license_plate(self, n: int, battery: bool = False, symbol: str = "· ") -> Any:
+        """车牌号，定长 Unicode 数组，格式与 Faker.license_plate 相同"""
+        if self._rng is None:
+            return [self._faker.license_plate(battery, symbol) for _ in range(n)]
+        rng = self._rng
+        provinces = _code_points("".join(_PLATE_PROVINCES))
+        letters = _code_points(_UPPERCASE)
+        tail = _code_points("0123456789" if battery else _PLATE_CHARS)
+        head = 2 + len(symbol)
+        width = head + 5 + battery
+
+        out = np.empty((n, width), dtype="<u4")
+        out[:, 0] = provinces[rng.integers(0, len(provinces), n)]
+        out[:, 1] = letters[rng.integers(0, len(letters), n)]
+        out[:, 2:head] = _code_points(symbol)
+        if battery:
+            # D代表纯电动新能源汽车，F代表非纯电动新能源汽车。
+            out[:, head] = _code_points("DF")[rng.integers(0, 2, n)]
+        out[:, width - 5 :] = tail[rng.integers(0, len(tail), (n, 5))]
+        return out.view(f"<U{width}").ravel()
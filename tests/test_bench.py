@@ -0,0 +1,56 @@
+import json
+
+from czo import bench
+
+
+def _run(pattern: str) -> dict:
+    return bench.run(pattern, warmup=1, repeat=2, min_time=0.001, memory_calls=3)
+
+
+def test_run_measures_public_methods_and_skips_side_effects():
+    cases, skipped = bench.discover()
+    names = {case.name for case in cases}
+    assert {
+        "Faker.profile",
+        "Rand.random_ip",
+        "Net.parse_cidr",
+        "DateTime.timestamp",
+    } <= names
+    assert "Rand.random_file" in skipped and "Rand.random_file" not in names
+    assert not any(name.split(".")[1].startswith("_") for name in names)
+
+    report = _run(r"^(Rand\.random_int|Net\.ipaddress_generator|Faker\.profiles)$")
+    assert set(report["results"]) == {
+        "Rand.random_int",
+        "Net.ipaddress_generator",
+        "Faker.profiles",
+    }
+    for result in report["results"].values():
+        assert result["ops_per_sec"] >= result["ops_per_sec_median"] > 0
+        assert result["number"] >= 1
+    assert report["results"]["Faker.profiles"]["bytes_per_call"] > 100_000
+    json.dumps(report)
+
+
+def test_compare_flags_regressions_against_baseline(tmp_path, capsys):
+    report = _run(r"^Faker\.full_name$")
+    result = report["results"]["Faker.full_name"]
+    assert bench.compare(report, report) == []
+
+    baseline = json.loads(json.dumps(report))
+    baseline["results"]["Faker.full_name"]["ops_per_sec"] = result["ops_per_sec"] * 2
+    baseline["results"]["Faker.full_name"]["bytes_per_call"] = 0
+    regressions = bench.compare(report, baseline, threshold=0.2)
+    assert [item["metric"] for item in regressions] == ["ops_per_sec"]
+    assert regressions[0]["change"] < -0.2
+
+    path = tmp_path / "baseline.json"
+    path.write_text(json.dumps(baseline), encoding="utf-8")
+    output = tmp_path / "results.json"
+    argv = ["-k", r"^Faker\.full_name$", "--repeat", "2", "--min-time", "0.001"]
+    assert bench.main([*argv, "--baseline", str(path), "-o", str(output)]) == 1
+    assert "退化 Faker.full_name ops_per_sec" in capsys.readouterr().out
+    assert (
+        "Faker.full_name" in json.loads(output.read_text(encoding="utf-8"))["results"]
+    )
+    assert bench.main(argv) == 0
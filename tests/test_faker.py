@@ -0,0 +1,805 @@
+import csv
+import datetime
+import json
+import random
+
+import pytest
+
+from czo import Faker
+from czo.utils import faker as faker_module
+from czo.utils._corpus import reservoir_sample
+from czo.utils.faker import UniquenessError, providers
+
+ID_WEIGHTS = [7, 9, 10, 5, 8, 4, 2, 1, 6, 3, 7, 9, 10, 5, 8, 4, 2]
+
+
+def assert_valid_id_number(id_number: str) -> None:
+    assert len(id_number) == 18
+    checksum = sum(int(c) * w for c, w in zip(id_number, ID_WEIGHTS))
+    assert "10X98765432"[checksum % 11] == id_number[-1]
+    datetime.datetime.strptime(id_number[6:14], "%Y%m%d")
+
+
+def test_profiles_batch_matches_profile_fields():
+    faker = Faker()
+    profiles = faker.profiles(200, zh=True)
+
+    assert len(profiles) == 200
+    assert faker.profiles(0) == []
+    assert all(list(p) == list(faker.profile(zh=True)) for p in profiles)
+    assert list(faker.profiles(1)[0]) == list(faker.profile())
+
+
+def test_profiles_batch_values_are_consistent():
+    today = datetime.date.today()
+
+    for profile in Faker().profiles(500):
+        id_number = profile["ID Card"]
+        assert_valid_id_number(id_number)
+
+        birthday = datetime.datetime.strptime(id_number[6:14], "%Y%m%d").date()
+        age = (
+            today.year
+            - birthday.year
+            - ((today.month, today.day) < (birthday.month, birthday.day))
+        )
+        assert profile["Age"] == age
+        assert profile["Sex"] == ("女" if int(id_number[16]) % 2 == 0 else "男")
+        assert len(str(profile["Phone Number"])) == 11
+        assert profile["MAC"].count(":") == 5
+        assert profile["Passport Number"].startswith("D")
+        assert len(profile["Passport Number"]) == 9
+
+
+def test_seed_reproduces_output():
+    assert Faker(seed=42).profiles(50) == Faker(seed=42).profiles(50)
+    assert Faker(seed=42).id_number() == Faker(seed=42).id_number()
+    assert Faker(seed=42).profiles(50) != Faker(seed=43).profiles(50)
+
+
+def test_spawn_children_are_deterministic_and_independent():
+    shards = Faker(seed=7).spawn(4)
+    again = Faker(seed=7).spawn(16)
+
+    for shard, other in zip(shards, again):
+        assert shard.profiles(20) == other.profiles(20)
+    assert len({tuple(s.phone_number() for _ in range(5)) for s in shards}) == 4
+
+    parent = Faker(seed=7)
+    first = [c.profiles(5) for c in parent.spawn(2)]
+    second = [c.profiles(5) for c in parent.spawn(2)]
+    assert first != second
+    assert second == [c.profiles(5) for c in Faker(seed=7).spawn(4)[2:4]]
+
+
+def test_write_profiles_jsonl_and_csv(tmp_path):
+    faker = Faker(seed=3)
+
+    jsonl = tmp_path / "profiles.jsonl"
+    stats = faker.write_profiles(jsonl, 25, chunk_size=10)
+    lines = jsonl.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 25
+    assert json.loads(lines[0]).keys() == faker.profile().keys()
+    assert stats["records"] == 25
+    assert stats["bytes"] == jsonl.stat().st_size
+    assert stats["bytes_per_second"] > 0
+
+    csv_path = tmp_path / "profiles.csv"
+    faker.write_profiles(csv_path, 25, format="csv", chunk_size=10, zh=True)
+    with open(csv_path, encoding="utf-8", newline="") as f:
+        rows = list(csv.reader(f))
+    assert len(rows) == 26
+    assert rows[0] == list(faker.profile(zh=True))
+
+    with pytest.raises(ValueError):
+        faker.write_profiles(tmp_path / "profiles.xml", 1, format="xml")
+
+
+def test_iter_profiles_chunks():
+    chunks = list(Faker(seed=3).iter_profiles(25, chunk_size=10))
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+
+
+def test_generate_parallel_is_independent_of_worker_count(tmp_path):
+    single = Faker(seed=11).generate_parallel(45, workers=1, chunk_size=10)
+    multi = Faker(seed=11).generate_parallel(45, workers=3, chunk_size=10)
+    assert len(single) == 45
+    assert single == multi
+
+    one = tmp_path / "one.jsonl"
+    two = tmp_path / "two.jsonl"
+    Faker(seed=11).generate_parallel(45, workers=1, sink=one, chunk_size=10)
+    stats = Faker(seed=11).generate_parallel(45, workers=2, sink=two, chunk_size=10)
+    assert one.read_bytes() == two.read_bytes()
+    assert stats["bytes"] == two.stat().st_size
+    assert [json.loads(line) for line in two.read_text("utf-8").splitlines()] == single
+
+    chunks = []
+    Faker(seed=11).generate_parallel(45, workers=2, sink=chunks.append, chunk_size=10)
+    assert [len(chunk) for chunk in chunks] == [10, 10, 10, 10, 5]
+
+
+def test_generate_parallel_does_not_advance_spawn():
+    faker = Faker(seed=11)
+    first = faker.generate_parallel(25, workers=1, chunk_size=10)
+    assert faker.generate_parallel(25, workers=1, chunk_size=10) == first
+    assert [c.profiles(5) for c in faker.spawn(2)] == [
+        c.profiles(5) for c in Faker(seed=11).spawn(2)
+    ]
+
+
+def test_generate_parallel_spawn_workers_attach_shared_datasets():
+    import pickle
+    from multiprocessing import shared_memory
+
+    from czo.utils._shared import share_datasets
+    from czo.utils._table import open_packed
+
+    single = Faker(seed=11).generate_parallel(45, workers=1, chunk_size=10)
+    shared = Faker(seed=11).generate_parallel(
+        45, workers=2, chunk_size=10, start_method="spawn", shared=True
+    )
+    assert shared == single
+
+    with share_datasets(["store_name"]) as datasets:
+        assert pickle.loads(pickle.dumps(datasets)) == datasets
+        assert datasets.names == ("store_name",)
+        assert datasets.nbytes == len(open_packed("store_name").values.buffer)
+        ((_, block, size),) = datasets.blocks
+        memory = shared_memory.SharedMemory(name=block)
+        assert bytes(memory.buf[:size]) == bytes(
+            open_packed("store_name").values.buffer
+        )
+        memory.close()
+
+
+def test_id_number_region_filters():
+    faker = Faker(seed=5)
+
+    assert all(faker.id_number(province="33").startswith("33") for _ in range(50))
+    assert all(faker.id_number(city="3301").startswith("3301") for _ in range(50))
+    assert faker.id_number(district="330108").startswith("330108")
+
+    batch = faker.id_numbers(200, city="3301")
+    assert len(batch) == 200
+    assert all(id_number.startswith("3301") for id_number in batch)
+    for id_number in batch:
+        assert_valid_id_number(id_number)
+
+    with pytest.raises(ValueError):
+        faker.id_number(province="00")
+    with pytest.raises(ValueError):
+        faker.id_number(province="11", city="3301")
+
+
+def test_compile_schema_records_and_batches():
+    faker = Faker(seed=9)
+    record = faker.compile(
+        {
+            "name": "full_name",
+            "phone": "phone_number",
+            "city": ("province", {"long": True}),
+            "id": ("id_number", {"city": "3301"}),
+            "plate": ("license_plate", {"battery": True}),
+        }
+    )
+
+    assert record.fields == ("name", "phone", "city", "id", "plate")
+    single = record()
+    assert isinstance(single, tuple) and len(single) == 5
+
+    rows = record.generate(300)
+    assert len(rows) == 300
+    assert record.generate(0) == []
+    for name, phone, city, id_number, plate in rows:
+        assert 2 <= len(name) <= 4
+        assert len(str(phone)) == 11
+        assert city.endswith(("省", "市", "区"))
+        assert id_number.startswith("3301")
+        assert_valid_id_number(id_number)
+        assert len(plate) == 10
+
+    with pytest.raises(ValueError):
+        faker.compile({"x": "no_such_method"})
+    with pytest.raises(ValueError):
+        faker.compile({"x": "_column"})
+    with pytest.raises(TypeError):
+        faker.compile({"x": "unique"})
+
+
+def test_unique_proxy_backends_and_stats():
+    faker = Faker(seed=13)
+
+    values = [faker.unique.id_number(city="3301") for _ in range(300)]
+    assert len(set(values)) == 300
+    batch = faker.unique.generate("id_number", 300, city="3301")
+    assert len(set(batch) | set(values)) == 600
+
+    faker.unique.configure("bloom", "phone_number", capacity=1000, error_rate=1e-4)
+    phones = faker.unique.generate("phone_number", 500)
+    phones.append(faker.unique.phone_number())
+    assert len(set(phones)) == 501
+
+    stats = faker.unique.stats()
+    assert stats["id_number"]["backend"] == "set"
+    assert stats["id_number"]["calls"] == 600
+    assert stats["phone_number"]["backend"] == "bloom"
+    assert stats["phone_number"]["values"] == 501
+    assert stats["phone_number"]["bytes"] > 0
+
+    faker.unique.configure(max_retries=5)
+    with pytest.raises(UniquenessError):
+        for _ in range(10):
+            faker.unique.sex()
+    assert faker.unique.stats()["sex"]["retries"] > 5
+
+    child = faker.spawn(1)[0]
+    assert child.unique.stats() == {}
+    with pytest.raises(AttributeError):
+        faker.unique.no_such_method()
+    with pytest.raises(TypeError):
+        faker.unique.unique()
+    with pytest.raises(ValueError):
+        faker.unique.configure("cuckoo")
+
+
+@pytest.mark.parametrize("numpy", [True, False])
+def test_validate_and_decode_id_numbers(tmp_path, monkeypatch, numpy):
+    if numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(faker_module, "_numpy", lambda: None)
+    faker = Faker(seed=17)
+    ids = faker.id_numbers(500)
+    wrong_check = ids[0][:17] + ("0" if ids[0][17] != "0" else "1")
+    invalid = [wrong_check, "123", "11010519490231002X", "1101051949123100２X"]
+
+    assert all(faker.validate_id_numbers(ids, chunk_size=64))
+    assert list(faker.validate_id_numbers(invalid)) == [False] * 4
+    assert list(faker.validate_id_numbers(["11010519491231002x"])) == [True]
+
+    path = tmp_path / "ids.txt"
+    path.write_text("\n".join(ids + invalid) + "\n", encoding="utf-8")
+    assert sum(faker.validate_id_numbers(path, chunk_size=100)) == 500
+
+    decoded = next(faker.decode_id_numbers(["11010519491231002X"]))
+    assert decoded["valid"] is True
+    assert decoded["area"] == "北京市朝阳区"
+    assert decoded["birthday"] == datetime.date(1949, 12, 31)
+    assert decoded["sex"] == "女"
+    assert decoded["age"] >= 76
+
+    profiles = faker.profiles(100)
+    for profile, info in zip(
+        profiles, faker.decode_id_numbers(p["ID Card"] for p in profiles)
+    ):
+        assert info["valid"]
+        assert info["sex"] == profile["Sex"]
+        assert info["age"] == profile["Age"]
+        assert profile["Address"].startswith(info["area"])
+    assert next(faker.decode_id_numbers(["123"]))["birthday"] is None
+    assert next(faker.decode_id_numbers([wrong_check])) == {
+        "id_number": wrong_check,
+        "valid": False,
+        "area": None,
+        "birthday": None,
+        "sex": None,
+        "age": None,
+    }
+    unknown_area = "99999919491231001"
+    unknown_area += faker_module._id_check_code(unknown_area)
+    info = next(faker.decode_id_numbers([unknown_area, ids[0]]))
+    assert info["valid"] and info["area"] is None and info["sex"] == "男"
+
+
+def test_weighted_sampling_follows_frequency_tables():
+    from czo.data._frequency import frequency
+    from czo.utils._alias import AliasTable
+
+    table = AliasTable(["a", "b", "c"], [1, 0, 3])
+    rand = Faker(seed=1)._random.random
+    draws = table.samples(rand, 20000)
+    assert "b" not in draws
+    assert 0.7 < draws.count("c") / len(draws) < 0.8
+    assert table.sample(rand) in ("a", "c")
+    with pytest.raises(ValueError):
+        AliasTable(["a"], [1, 2])
+
+    faker = Faker(seed=1, weighted=True)
+    names = faker._column("last_name", 20000)
+    assert names.count("王") > 20 * names.count("慕容") + 1000
+    assert set(names) <= frequency["last_name"].keys()
+    ethnicities = [faker.ethnicity() for _ in range(2000)]
+    assert ethnicities.count("汉族") > 1700
+    assert faker.province() in faker._column("province", 10000)
+
+    child = faker.spawn(1)[0]
+    assert child._column("education", 5000).count("博士") < 50
+    assert Faker(seed=1, weighted=True).profiles(20) == Faker(
+        seed=1, weighted=True
+    ).profiles(20)
+
+
+def test_profile_address_landline_and_id_area_are_consistent():
+    from czo.utils._region import address_index
+
+    index = address_index()
+    assert index.addresses("330108")
+    assert set(index.addresses("330108")) <= set(index.addresses("3301"))
+    assert "010" in index.landlines["11"]
+
+    for profile in Faker(seed=21).profiles(2000):
+        code = profile["ID Card"][:6]
+        prefix = profile["Landline Number"].split("-")[0]
+        assert prefix in index.landlines[code[:2]]
+        if code in index.by_code:
+            assert profile["Address"] in index.by_code[code]
+
+    faker = Faker(seed=21)
+    assert faker.address(district="330108").startswith("浙江省杭州市滨江区")
+    assert faker.address(province="11").startswith("北京市")
+    assert all(
+        address.startswith("安徽省")
+        for address in faker._column("address", 50, {"province": "34"})
+    )
+    assert faker.landline_number(province="33").split("-")[0] in index.landlines["33"]
+    with pytest.raises(ValueError):
+        faker.landline_number(province="00")
+    with pytest.raises(ValueError):
+        faker.address(city="0000")
+
+
+@pytest.mark.parametrize(
+    "as_of", [datetime.date(2024, 2, 29), datetime.date(2025, 2, 28), None]
+)
+def test_id_number_age_range_and_as_of(as_of):
+    faker = Faker(seed=23, as_of=as_of)
+    reference = as_of or datetime.date.today()
+
+    def age(id_number):
+        birthday = datetime.datetime.strptime(id_number[6:14], "%Y%m%d").date()
+        return (
+            reference.year
+            - birthday.year
+            - ((reference.month, reference.day) < (birthday.month, birthday.day))
+        )
+
+    single = [faker.id_number(min_age=18, max_age=20) for _ in range(300)]
+    batch = faker.id_numbers(3000, min_age=18, max_age=20)
+    assert {age(id_number) for id_number in single + batch} == {18, 19, 20}
+    for id_number in single:
+        assert_valid_id_number(id_number)
+
+    exact = faker.id_numbers(500, min_age=0, max_age=0)
+    assert {age(id_number) for id_number in exact} == {0}
+    assert {info["age"] for info in faker.decode_id_numbers(exact)} == {0}
+
+    for profile in faker.spawn(1)[0].profiles(200):
+        assert profile["Age"] == age(profile["ID Card"])
+    # 只指定很大的 min_age 时放宽到 1900 年之后的出生日期
+    old = [faker.id_number(min_age=100) for _ in range(50)]
+    old += faker.id_numbers(3000, min_age=100)
+    assert all(100 <= age(id_number) <= 110 for id_number in old)
+    for id_number in old[:50]:
+        assert_valid_id_number(id_number)
+
+    with pytest.raises(ValueError):
+        faker.id_number(min_age=30, max_age=20)
+    with pytest.raises(ValueError):
+        faker.id_numbers(1, max_age=500)
+
+
+def test_provider_registry_loads_once_and_preloads():
+    from czo.utils._registry import Registry
+
+    calls = []
+    registry = Registry()
+
+    @registry.register("numbers")
+    def load_numbers():
+        calls.append(1)
+        return [1, 2, 3]
+
+    assert registry.loaded == ()
+    assert registry["numbers"] is registry["numbers"]
+    assert calls == [1]
+    registry.preload()
+    assert calls == [1]
+    with pytest.raises(KeyError):
+        registry["missing"]
+
+    assert {"address", "country", "id_number", "region"} <= set(providers.names)
+    Faker(preload=["address", "country"])
+    assert {"address", "country"} <= set(providers.loaded)
+    Faker(preload=True)
+    assert set(providers.loaded) == set(providers.names)
+    zh_country, en_country = providers["country"]
+    assert Faker(seed=1).country(en=True) in en_country
+    assert Faker(seed=1).country() in zh_country
+
+
+def test_tables_are_deduplicated_with_optional_weights():
+    from czo.utils._registry import deep_sizeof
+    from czo.utils._table import Table
+
+    table = Table.from_items(["潮悦汇", ("月明盲人推拿", 3), "潮" + "悦汇"])
+    assert table.values == ("潮悦汇", "月明盲人推拿")
+    assert table.weights == (2, 3)
+    assert len(table) == 2
+    with pytest.raises(ValueError):
+        Table.from_items([("潮悦汇", -1)])
+
+    for name in ("address", "store_name"):
+        values = providers[name].values
+        assert len(values) == len(set(values))
+    assert Faker(seed=2).store_name() in providers["store_name"].values
+    weighted = Faker(seed=2, weighted=True)
+    assert weighted.address() in providers["address"].values
+    assert set(weighted._column("store_name", 20)) <= set(
+        providers["store_name"].values
+    )
+
+    Faker(preload=["address", "store_name"])
+    footprint = providers.footprint()
+    assert set(providers.loaded) <= set(footprint)
+    assert 0 < footprint["store_name"] == deep_sizeof(providers["store_name"])
+    assert deep_sizeof(["潮悦汇", "潮悦汇"]) < deep_sizeof(["潮悦汇", "潮悦汇" + "!"])
+
+
+def test_packed_tables_are_up_to_date_and_decode_by_index():
+    from czo.data import _build
+    from czo.data._housing import housing
+    from czo.utils._table import (
+        PACKED_NAMES,
+        PackedTable,
+        Table,
+        open_packed,
+        pack,
+        population,
+    )
+
+    assert set(_build.SOURCES) == set(PACKED_NAMES)
+    assert _build.stale() == [], "请运行 python -m czo.data._build 重新打包"
+    assert _build.main(["--check"]) == 0
+
+    packed = PackedTable(
+        pack(Table.from_items(["潮悦汇", ("月明盲人推拿", 3), "", "潮悦汇"]))
+    )
+    assert len(packed) == 3
+    assert (packed[0], packed[1], packed[2], packed[-3]) == (
+        "潮悦汇",
+        "月明盲人推拿",
+        "",
+        "潮悦汇",
+    )
+    assert list(packed.weights) == [2, 3, 1]
+    assert packed[1:] == ["月明盲人推拿", ""]
+    assert list(packed) == ["潮悦汇", "月明盲人推拿", ""]
+    with pytest.raises(IndexError):
+        packed[3]
+    with pytest.raises(ValueError):
+        PackedTable(b"not a table")
+
+    residence = open_packed("residence")
+    assert residence is open_packed("residence")
+    assert list(residence.values) == housing
+    assert random.Random(1).choice(residence.values) in housing
+    assert population(residence.values, 1) is residence.values
+    assert population(residence.values, len(housing)) == housing
+
+    # 源数据保留原始的重复条目，打包时合并为权重
+    from czo.data._addr import addr_info_list
+
+    address = open_packed("address")
+    assert sum(address.weights) == len(addr_info_list) > len(address)
+    first = address.values[0]
+    assert address.weights[0] == addr_info_list.count(first)
+
+
+def test_to_sqlite_creates_table_rows_and_indexes(tmp_path):
+    import sqlite3
+
+    path = tmp_path / "profiles.db"
+    stats = Faker(seed=29).to_sqlite(
+        path,
+        "people",
+        250,
+        fields=["name", "id_card", "age", "landline_number"],
+        indexes=["id_card", ("name", "age")],
+        chunk_size=100,
+    )
+    assert stats["records"] == 250
+    assert stats["records_per_second"] > 0
+
+    with sqlite3.connect(path) as connection:
+        rows = connection.execute("SELECT * FROM people").fetchall()
+        columns = connection.execute("PRAGMA table_info(people)").fetchall()
+        index_names = {
+            row[0]
+            for row in connection.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index'"
+            )
+        }
+    assert len(rows) == 250
+    assert [(c[1], c[2]) for c in columns] == [
+        ("name", "TEXT"),
+        ("id_card", "TEXT"),
+        ("age", "INTEGER"),
+        ("landline_number", "TEXT"),
+    ]
+    assert index_names == {"people_id_card_idx", "people_name_age_idx"}
+    for _, id_card, _, _ in rows:
+        assert_valid_id_number(id_card)
+
+    faker = Faker(seed=29)
+    with pytest.raises(ValueError):
+        faker.to_sqlite(path, "people", 10)
+    faker.to_sqlite(
+        path,
+        "people",
+        10,
+        if_exists="append",
+        fields=["name", "id_card", "age", "landline_number"],
+    )
+    faker.to_sqlite(path, "phones", 20, fields={"phone": "phone_number"})
+    faker.to_sqlite(path, "people", 5, fields=["email"], if_exists="replace")
+    with sqlite3.connect(path) as connection:
+        assert connection.execute("SELECT COUNT(*) FROM phones").fetchone() == (20,)
+        assert connection.execute("SELECT COUNT(*) FROM people").fetchone() == (5,)
+    # 生成失败时回滚，被替换的表保持原样
+    with pytest.raises(ValueError):
+        faker.to_sqlite(
+            path,
+            "people",
+            5,
+            fields={"id": ("id_number", {"province": "99"})},
+            if_exists="replace",
+        )
+    with sqlite3.connect(path) as connection:
+        assert connection.execute("SELECT COUNT(*) FROM people").fetchone() == (5,)
+        assert connection.execute("SELECT email FROM people").fetchone()[0]
+    with pytest.raises(ValueError):
+        faker.to_sqlite(path, "other", 1, fields=["no_such_field"])
+    with pytest.raises(ValueError):
+        faker.to_sqlite(path, "other", 1, fields=["name"], indexes=["age"])
+
+
+def test_to_sqlite_keeps_wal_journal_mode(tmp_path):
+    import sqlite3
+
+    path = tmp_path / "wal.db"
+    with sqlite3.connect(path) as connection:
+        assert connection.execute("PRAGMA journal_mode = WAL").fetchone() == ("wal",)
+
+    Faker(seed=5).to_sqlite(path, "people", 10, fields=["name"])
+    with sqlite3.connect(path) as connection:
+        assert connection.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+        assert connection.execute("SELECT COUNT(*) FROM people").fetchone() == (10,)
+
+
+def test_aprofiles_yields_batches_in_background():
+    import asyncio
+
+    async def collect(n, **kwargs):
+        return [b async for b in Faker(seed=31).aprofiles(n, **kwargs)]
+
+    batches = asyncio.run(collect(25, batch=10, prefetch=1))
+    assert [len(b) for b in batches] == [10, 10, 5]
+    assert batches == list(Faker(seed=31).iter_profiles(25, chunk_size=10))
+    assert asyncio.run(collect(0)) == []
+
+    async def first_only():
+        async for batch in Faker(seed=31).aprofiles(10_000, batch=100):
+            return batch
+
+    assert len(asyncio.run(first_only())) == 100
+    with pytest.raises(ValueError):
+        asyncio.run(collect(10, batch=0))
+
+
+def test_profile_records_convert_to_dicts_and_rows():
+    from czo.utils.faker import Profile
+
+    records = Faker(seed=37).profiles(50, record=True)
+    dicts = Faker(seed=37).profiles(50, zh=True)
+    assert all(isinstance(record, Profile) for record in records)
+    assert [record.to_dict(zh=True) for record in records] == dicts
+    assert records[0].id_card == dicts[0]["身份证"]
+    assert records[0].to_row() == tuple(dicts[0].values())
+    assert type(records[0].to_row()) is tuple
+    assert not hasattr(records[0], "__dict__")
+
+    single = Faker(seed=37).profile(record=True)
+    assert single.to_dict(zh=True) == Faker(seed=37).profile(zh=True)
+    assert single.to_dict().keys() == Faker().profile().keys()
+    chunks = list(Faker(seed=37).iter_profiles(50, chunk_size=20, record=True))
+    assert [len(chunk) for chunk in chunks] == [20, 20, 10]
+
+
+def test_profile_fields_run_only_selected_generators(monkeypatch):
+    faker = Faker(seed=5)
+    calls: list[str] = []
+    column = faker._column
+    monkeypatch.setattr(
+        faker,
+        "_column",
+        lambda method, n, *a: calls.append(method) or column(method, n, *a),
+    )
+    id_columns = faker._Faker__id_columns
+    id_calls: list[int] = []
+    monkeypatch.setattr(
+        faker,
+        "_Faker__id_columns",
+        lambda n, *a: id_calls.append(n) or id_columns(n, *a),
+    )
+
+    person = faker.profile(fields=["age", "name", "sex"])
+    assert list(person) == ["Age", "Name", "Sex"]
+    assert calls == ["full_name"]
+    assert id_calls == [1]
+
+    people = faker.profiles(10, zh=True, exclude=["school", "residence", "address"])
+    assert len(people[0]) == 19
+    assert "学校" not in people[0] and "居住地" not in people[0]
+    assert "school" not in calls and "residence" not in calls
+    assert id_calls == [1, 10]
+
+    assert faker.profile(fields=["name", "email"], exclude=["email"]).keys() == {"Name"}
+    chunks = list(faker.iter_profiles(5, chunk_size=2, fields=iter(["phone_number"])))
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert all(row.keys() == {"Phone Number"} for chunk in chunks for row in chunk)
+
+    with pytest.raises(ValueError, match="未知"):
+        faker.profile(fields=["nickname"])
+    with pytest.raises(ValueError):
+        faker.profile(fields=["name"], exclude=["name"])
+    with pytest.raises(ValueError):
+        faker.profiles(3, record=True, fields=["name"])
+    assert isinstance(faker.profile(record=True, exclude=[]), tuple)
+
+
+def test_region_tree_lookups_and_faker_region():
+    from czo.utils.faker import Region, region_tree
+
+    tree = region_tree()
+    assert tree is region_tree()
+    assert tree.parent("330108") == "330100"
+    assert tree.parent("3301") == tree.parent("330100") == "330000"
+    assert tree.parent("33") is None
+    assert "330108" in tree.children("3301")
+    assert all(tree.parent(code) == "330000" for code in tree.children("33"))
+    assert "330000" in tree.children()
+    assert tree.children("330108") == ()
+    assert tree.full_name("330108") == "浙江省杭州市滨江区"
+    assert [tree.level(code) for code in ("33", "3301", "330108")] == [
+        "province",
+        "city",
+        "district",
+    ]
+    assert tree.select("district", "330108") == ("330108",)
+    with pytest.raises(ValueError):
+        tree.parent("999999")
+    with pytest.raises(ValueError):
+        tree.select("province", "3301")
+    with pytest.raises(ValueError):
+        tree.select("town")
+
+    faker = Faker(seed=8)
+    region = faker.region(under="3301")
+    assert isinstance(region, Region)
+    assert region.code.startswith("3301") and tree.level(region.code) == "district"
+    assert region.name == tree.full_name(region.code)
+    assert tree.level(faker.region("province").code) == "province"
+    cities = faker._column("region", 200, {"level": "city", "under": "44"})
+    assert {tree.parent(city.code) for city in cities} == {"440000"}
+    assert Faker(seed=3).region() == Faker(seed=3).region()
+
+
+def test_region_names_exact_longest_prefix_and_enumeration():
+    from czo.utils.faker import region_names, region_tree
+
+    names = region_names()
+    assert names is region_names()
+    assert names.get("浙江省杭州市滨江区") == ("330108",)
+    assert names.get("杭州市滨江区") == ("330108",)
+    assert len(names.get("市辖区")) > 1
+    assert names.get("不存在的地方") == ()
+
+    assert names.longest_prefix("杭州市滨江区长河街道泰安路9号") == (
+        "杭州市滨江区",
+        ("330108",),
+    )
+    assert names.longest_prefix("浙江省杭州市滨江区星光大道") == (
+        "浙江省杭州市滨江区",
+        ("330108",),
+    )
+    assert names.longest_prefix("浙江省某某路") == ("浙江省", ("330000",))
+    assert names.longest_prefix("长河街道") is None
+
+    completions = list(names.startswith("浙江省杭州市"))
+    assert completions[0] == ("浙江省杭州市", ("330100",))
+    assert all(name.startswith("浙江省杭州市") for name, _ in completions)
+    assert {codes[0] for _, codes in completions} == {
+        "330100",
+        *region_tree().children("3301"),
+    }
+    assert list(names.startswith("没有")) == []
+
+
+def test_register_corpus_samples_and_caches_by_file_version(tmp_path):
+    corpus = tmp_path / "shops.txt"
+    corpus.write_text("".join(f"店铺{i}\n" for i in range(5000)), encoding="utf-8")
+    cache_dir = tmp_path / "cache"
+    try:
+        table = Faker.register_corpus(
+            "store_name", corpus, sample_size=200, cache_dir=cache_dir
+        )
+        assert len(table) == 200
+        assert set(table.values) <= {f"店铺{i}" for i in range(5000)}
+        assert providers["store_name"] is table
+        assert Faker(seed=1).store_name() in table.values
+        assert Faker(seed=1, weighted=True).store_name() in table.values
+        (cached,) = cache_dir.iterdir()
+
+        # 文件不变时直接使用缓存，样本相同；其他抽样参数的缓存与之共存
+        again = Faker.register_corpus(
+            "store_name", corpus, sample_size=200, cache_dir=cache_dir
+        )
+        assert list(again.values) == list(table.values)
+        Faker.register_corpus("address", corpus, sample_size=50, cache_dir=cache_dir)
+        assert len(list(cache_dir.iterdir())) == 2
+        assert cached.exists()
+
+        # 文件变化后重新抽样，写入新的缓存
+        with corpus.open("a", encoding="utf-8") as f:
+            f.write("新店铺\n")
+        changed = Faker.register_corpus(
+            "store_name", corpus, sample_size=200, cache_dir=cache_dir
+        )
+        assert set(changed.values) <= set(corpus.read_text("utf-8").split())
+        # Windows 上旧缓存仍被映射时不能删除，只检查新缓存已经写入
+        assert any(path.name != cached.name for path in cache_dir.iterdir())
+    finally:
+        Faker.register_corpus("store_name", None)
+        Faker.register_corpus("address", None)
+    assert providers["store_name"] is faker_module.open_packed("store_name")
+
+
+def test_register_corpus_reads_csv_and_jsonl_columns(tmp_path):
+    cache_dir = tmp_path / "cache"
+    rows = tmp_path / "addresses.csv"
+    rows.write_text("id,address\n1,甲地\n2,乙地\n3,\n", encoding="utf-8")
+    lines = tmp_path / "addresses.jsonl"
+    lines.write_text('{"address": "丙地"}\n"丁地"\n\n', encoding="utf-8")
+    try:
+        table = Faker.register_corpus(
+            "address", rows, column="address", cache_dir=cache_dir
+        )
+        assert sorted(table.values) == ["乙地", "甲地"]
+        assert Faker().address() in ("甲地", "乙地")
+        assert set(Faker()._column("address", 20)) <= {"甲地", "乙地"}
+
+        table = Faker.register_corpus(
+            "address", lines, column="address", cache_dir=cache_dir
+        )
+        assert sorted(table.values) == ["丁地", "丙地"]
+
+        with pytest.raises(ValueError):
+            Faker.register_corpus("country", rows, cache_dir=cache_dir)
+        with pytest.raises(ValueError):
+            Faker.register_corpus(
+                "address", rows, column="missing", cache_dir=cache_dir
+            )
+        with pytest.raises(TypeError):
+            Faker.register_corpus("address", lines, cache_dir=cache_dir)
+    finally:
+        Faker.register_corpus("address", None)
+
+
+def test_reservoir_sample_is_uniform():
+    counts = [0] * 20
+    for seed in range(2000):
+        for item in reservoir_sample(map(str, range(20)), 5, random.Random(seed)):
+            counts[int(item)] += 1
+    assert all(400 < count < 600 for count in counts)
+    assert reservoir_sample(["a", "b"], 5, random.Random(1)) == ["a", "b"]
@@ -0,0 +1,78 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC: str = str(Path(__file__).resolve().parents[1] / "src")
+
+# import czo 的累计耗时上限（微秒），只导入包本身，不包含解释器启动
+IMPORT_BUDGET_US: int = 30_000
+
+HEAVY_MODULES: tuple[str, ...] = (
+    "asyncio",
+    "concurrent.futures.process",
+    "czo.utils.faker",
+    "hashlib",
+    "inspect",
+    "ipaddress",
+    "multiprocessing",
+    "secrets",
+    "shutil",
+    "uuid",
+)
+
+
+def _python(*args: str) -> subprocess.CompletedProcess:
+    env = {**os.environ, "PYTHONPATH": SRC}
+    return subprocess.run(
+        [sys.executable, *args], capture_output=True, text=True, env=env, check=True
+    )
+
+
+def _import_times(statement: str) -> dict[str, int]:
+    """-X importtime 报告的各模块累计导入耗时（微秒）"""
+    stderr: str = _python("-X", "importtime", "-c", statement).stderr
+    times: dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, module = line.split("|")
+        if cumulative.strip().isdigit():
+            times[module.strip()] = int(cumulative)
+    return times
+
+
+def test_import_czo_stays_within_budget():
+    # 取多次中的最小值，排除机器偶发繁忙的影响
+    elapsed = min(_import_times("import czo")["czo"] for _ in range(3))
+    assert elapsed < IMPORT_BUDGET_US, f"import czo 耗时 {elapsed} 微秒"
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import czo",
+        "from czo import DateTime",
+        "from czo import Paths",
+        "from czo import Net",
+    ],
+)
+def test_heavy_modules_are_not_imported_eagerly(statement):
+    loaded = _import_times(statement)
+    assert not [module for module in HEAVY_MODULES if module in loaded]
+
+
+def test_lazy_attributes_resolve_on_first_use():
+    code = (
+        "import sys, czo\n"
+        "assert 'czo.utils.faker' not in sys.modules\n"
+        "assert set(czo.__all__) <= set(dir(czo))\n"
+        "from czo.utils.faker import Faker\n"
+        "assert czo.Faker is Faker and 'Faker' in vars(czo)\n"
+        "print(czo.Rand.__module__)"
+    )
+    assert _python("-c", code).stdout.strip() == "czo.utils.randgen"
+    with pytest.raises(subprocess.CalledProcessError):
+        _python("-c", "import czo; czo.missing")
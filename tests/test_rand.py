@@ -1,3 +1,7 @@
+import asyncio
+
+import pytest
+
 from czo import Rand
 
 
@@ -11,3 +15,15 @@ def test_rand_hostname():
     a = Rand.random_hostname()
     b = Rand.random_hostname()
     assert a != b
+
+
+def test_rand_agenerate_batches():
+    async def collect():
+        return [batch async for batch in Rand.agenerate("random_mac", 25, batch=10)]
+
+    batches = asyncio.run(collect())
+    assert [len(batch) for batch in batches] == [10, 10, 5]
+    assert all(mac.count(":") == 5 for batch in batches for mac in batch)
+
+    with pytest.raises(ValueError):
+        Rand.agenerate("no_such_method", 1)
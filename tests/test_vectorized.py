@@ -0,0 +1,54 @@
+import pytest
+
+from czo import vectorized
+from czo.vectorized import Vectorized
+
+FIELDS = [
+    "phone_number",
+    "age",
+    "latitude",
+    "longitude",
+    "mac_address",
+    "passport_number",
+    "license_plate",
+]
+
+
+def check_values(v: Vectorized, n: int) -> None:
+    assert all(len(str(p)) == 11 for p in v.phone_number(n))
+    assert all(16 <= a <= 101 for a in v.age(n))
+    assert all(-90 <= x <= 90 for x in v.latitude(n))
+    assert all(-180 <= x <= 180 for x in v.longitude(n))
+
+    for mac in v.mac_address(n):
+        mac = mac.decode() if isinstance(mac, bytes) else mac
+        assert len(mac) == 17 and mac.count(":") == 5
+    for passport in v.passport_number(n):
+        passport = passport.decode() if isinstance(passport, bytes) else passport
+        assert passport[0] == "D" and passport[1:].isdigit()
+    for plate in v.license_plate(n):
+        assert len(plate) == 9 and plate[2:4] == "· "
+
+
+def test_numpy_backend_returns_arrays():
+    np = pytest.importorskip("numpy")
+    v = Vectorized(seed=1)
+
+    for field in FIELDS:
+        assert isinstance(getattr(v, field)(10), np.ndarray)
+    assert v.mac_address(4).dtype == np.dtype("S17")
+    assert v.passport_number(4).tobytes()[:1] == b"D"
+    assert all(len(p) == 10 for p in v.license_plate(20, battery=True))
+    check_values(v, 500)
+
+    a, b = Vectorized(seed=2), Vectorized(seed=2)
+    assert (a.phone_number(100) == b.phone_number(100)).all()
+
+
+def test_fallback_without_numpy(monkeypatch):
+    monkeypatch.setattr(vectorized, "HAS_NUMPY", False)
+    v = Vectorized(seed=1)
+
+    for field in FIELDS:
+        assert isinstance(getattr(v, field)(10), list)
+    check_values(v, 200)